@@ -0,0 +1,73 @@
+"""Generates synthetic tables for the benchmarks."""
+
+import sys
+from pathlib import Path
+from random import Random
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tabling import Table  # pylint: disable=wrong-import-position
+
+COLUMNS = 10
+"""Number of columns in every generated table."""
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+"""Number of cells in the generated tables by size name."""
+
+HEADER = ("id", "name", "city", "status", "qty", "price", "total", "date", "flag", "note")
+"""Header row of every generated table."""
+
+WORDS = ("alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india")
+CITIES = ("Harare", "Nairobi", "Lagos", "Accra", "Cairo", "Kampala", "Lusaka", "Dakar")
+STATUSES = ("open", "closed", "pending", "failed")
+
+
+def make_rows(cells: int, seed: int = 0) -> List[List[str]]:
+    """Makes the rows of a table with a header row and about the given number of cells."""
+    random = Random(seed)
+    rows = [list(HEADER)]
+    for index in range(1, max(cells // COLUMNS, 2)):
+        qty, price = random.randint(1, 500), random.randint(100, 99_999) / 100
+        rows.append(
+            [
+                f"{index}",
+                f"{random.choice(WORDS).title()} {random.choice(WORDS).title()}",
+                random.choice(CITIES),
+                random.choice(STATUSES),
+                f"{qty}",
+                f"{price:.2f}",
+                f"{qty * price:.2f}",
+                f"2024-{random.randint(1, 12):02}-{random.randint(1, 28):02}",
+                random.choice(("yes", "no")),
+                " ".join(random.choice(WORDS) for _ in range(random.randint(1, 6))),
+            ]
+        )
+    return rows
+
+
+def make_table(cells: int, styled: bool, seed: int = 0) -> Table:
+    """Makes a table with about the given number of cells, optionally styled."""
+    table = Table()
+    for row in make_rows(cells, seed):
+        table.add_row(row)
+    if styled:
+        style(table)
+    return table
+
+
+def style(table: Table) -> None:
+    """Styles a table the way a typical colored report is styled."""
+    table.border.style = "single"
+    table.border.color = "gray"
+    table[0].font.style = "bold"
+    table[0].font.color = "white"
+    table[0].background.color = "navy"
+    table[0].border.bottom.style = "single"
+    for index, row in enumerate(table[1:]):
+        if index % 2:
+            row.background.color = "whitesmoke"
+        row[3].font.color = "red" if row[3].value == "failed" else "green"
+        for cell in row[4:7]:
+            cell.text.justify = "right"
+        row[9].width = 24
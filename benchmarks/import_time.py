@@ -0,0 +1,65 @@
+"""Checks that `import tabling` stays fast and free of heavy or optional dependencies.
+
+Usage:
+    python benchmarks/import_time.py [--budget MILLISECONDS] [--runs N]
+
+`import tabling` is timed with `python -X importtime` in fresh interpreters, after a warm-up run
+that writes bytecode caches, and the best cumulative time is compared against the budget. The
+script exits with status 1 when the budget is exceeded or when any module in `DEFERRED` is
+imported.
+"""
+
+import os
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from subprocess import run
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BUDGET_MS = 40.0
+"""Largest allowed cumulative import time of `tabling` in milliseconds."""
+
+DEFERRED = ("printly", "difflib", "textwrap", "sqlite3", "csv", "json", "openpyxl")
+"""Modules that `import tabling` and `import tabling.io` must not import."""
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Gets the cumulative import time in microseconds of each module imported by a statement."""
+    process = run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        env={k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> int:
+    """Runs the check and returns the exit status."""
+    parser = ArgumentParser(description="Checks the import time of tabling.")
+    parser.add_argument("--budget", type=float, default=BUDGET_MS, help="budget in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time")
+    args = parser.parse_args()
+    import_times("import tabling, tabling.io")  # warm-up: compiles bytecode caches
+    best = min(import_times("import tabling")["tabling"] for _ in range(args.runs)) / 1000
+    imported = import_times("import tabling, tabling.io")
+    leaked = [module for module in DEFERRED if module in imported]
+    print(f"import tabling: {best:.1f} ms (budget {args.budget:.1f} ms)")
+    print(f"import tabling.io: {imported['tabling.io'] / 1000:.1f} ms")
+    if leaked:
+        print(f"deferred modules imported: {', '.join(leaked)}")
+    return int(best > args.budget or bool(leaked))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
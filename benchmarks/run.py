@@ -0,0 +1,285 @@
+"""Times table operations, rendering and every io format, and compares them to a baseline.
+
+Usage:
+    python benchmarks/run.py [--sizes 1k,100k,1m] [--only PATTERN] [--baseline FILE] [--save]
+
+Each benchmark runs on synthetic tables with and without styling. The best wall time of a few
+repeats and the peak memory of one traced run are recorded. Results are compared against the
+baseline JSON file, and the script exits with status 1 when any benchmark is slower or uses more
+memory than the baseline allows. Slowdowns under `NOISE_FLOOR` seconds are not counted, so short
+timings don't fail the comparison on a busy machine.
+"""
+
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from contextlib import redirect_stdout
+from copy import deepcopy
+from fnmatch import fnmatch
+from importlib.util import find_spec
+from io import StringIO
+from json import dump, load
+from pathlib import Path
+from platform import platform, python_version
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from data import SIZES, make_rows, make_table
+from tabling import Table
+from tabling.axis import Axis
+from tabling.cell import Cell
+from tabling.column import Column
+from tabling.computed import Computed
+from tabling.dtype import Category
+from tabling.element import Element
+from tabling.formatting import Heatmap, Style, Threshold, TopK
+from tabling.io import csv, html, json, md, sqlite, tbl, tsv, xlsx
+from tabling.lazy import LazyTable
+from tabling.rule import Rule
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+"""Default baseline file."""
+
+TIME_THRESHOLD = 1.25
+"""Largest allowed ratio of measured to baseline time."""
+
+MEMORY_THRESHOLD = 1.10
+"""Largest allowed ratio of measured to baseline peak memory."""
+
+NOISE_FLOOR = 0.010
+"""Smallest slowdown in seconds counted as a regression, as shorter ones are timing noise."""
+
+Setup = Callable[[], Any]
+Run = Callable[[Any], Any]
+
+
+def benchmarks(cells: int, styled: bool, folder: Path) -> Iterator[Tuple[str, Setup, Run]]:
+    """Yields the name, setup and run functions of every benchmark for a table size."""
+    rows = make_rows(cells)
+
+    def table() -> Table:
+        return make_table(cells, styled)
+
+    def categorical() -> Table:
+        new = table()
+        for index in (2, 3, 8):  # city, status, flag
+            new.set_dtype(index, "category")
+        return new
+
+    def collapsed() -> Table:
+        new = table()
+        new.border_collapse = True
+        return new
+
+    def striped() -> Table:
+        new = table()
+        new.add_rule(Rule(rows=0, font_style="bold"))
+        new.add_rule(Rule(nth=(2, 1), background="gray"))
+        new.add_rule(Rule(columns=3, where=lambda value: value == "failed", font_color="red"))
+        return new
+
+    def formatted() -> Table:
+        new = table()
+        for index in (4, 6):  # qty, total
+            new.set_dtype(index, "float")
+        new.add_format(Threshold(4, [10, 450], [Style(font_color="red"), None, Style("gold")]))
+        new.add_format(Heatmap(6, "white", "seagreen"))
+        new.add_format(TopK(6, 10, Style(font_style="bold")))
+        return new
+
+    def add_rows(_: Any) -> None:
+        new = Table()
+        for row in rows:
+            new.add_row(row)
+
+    def tail(_: Any) -> None:
+        new = Table(max_rows=100)
+        for row in rows:
+            new.add_row(row)
+
+    yield "add_row", lambda: None, add_rows
+    yield "add_row/ring", lambda: None, tail
+    yield "add_rows", lambda: None, lambda _: Table().add_rows(rows)
+    yield "concat", table, lambda t: Table.concat((t, t))
+    yield "join", table, lambda t: t.join(t, "id")
+    yield "group_by", table, lambda t: t.group_by("city").agg({"qty": "sum", "total": "mean"})
+    yield "pivot", table, lambda t: t.pivot("city", "status", "total")
+    yield "insert_column", table, lambda t: t.insert_column(0, range(len(t)))
+    yield "remove_row", table, lambda t: t.remove_row(len(t) // 2)
+    yield "delete_rows", table, lambda t: t.delete_rows(range(1, len(t), 2))
+    yield "delete_where", table, lambda t: t.delete_where(lambda row: row[3].value == "failed")
+    yield "sort_rows", table, lambda t: t.sort_rows(1, start=1)
+    yield "infer_dtypes", table, lambda t: t.infer_dtypes()
+    yield "copy", table, lambda t: t.copy()
+    yield "copy/generic", table, generic_deepcopy
+    yield "render", table, str
+    yield "render/fit", table, lambda t: t.render(max_width=80)
+    yield "render/collapse", collapsed, str
+    yield "render/rules", striped, str
+    yield "render/formats", formatted, str
+    yield "find", table, lambda t: redirect(lambda: t.find("Harare"))
+    yield "replace", table, lambda t: t.replace("Harare", "Bulawayo")
+    yield "replace/category", categorical, lambda t: t.replace("Harare", "Bulawayo")
+    yield "render/category", categorical, str
+    formats: Dict[str, Tuple[Any, Tuple[Any, ...]]] = {
+        "csv": (csv, ()),
+        "csv.gz": (csv, ()),
+        "tsv": (tsv, ()),
+        "json": (json, ()),
+        "md": (md, (True,)),
+        "html": (html, ()),
+        "sqlite": (sqlite, ("bench",)),
+        "tbl": (tbl, ()),
+    }
+    if find_spec("openpyxl") and cells <= 100_000:  # openpyxl addresses columns A-Z only
+        formats["xlsx"] = (xlsx, ())
+    for name, (module, args) in formats.items():
+        path = folder / f"{cells}-{int(styled)}.{name}"
+        load_args = args[1:] if name == "md" else args
+        dump_table = dumper(module, path, args)
+        yield f"dump/{name}", table, dump_table
+        yield f"load/{name}", lambda dump=dump_table: dump(table()), loader(module, path, load_args)
+        if name in ("csv", "tsv"):
+            parallel = loader(module, path, (False, None))
+            yield f"load/{name}/parallel", lambda dump=dump_table: dump(table()), parallel
+        if name == "csv":
+            yield "load/csv/lazy", lambda dump=dump_table: dump(table()), lambda _: page(path)
+
+
+def dumper(module: Any, path: Path, args: Tuple[Any, ...]) -> Run:
+    """Makes a function that dumps a table to a file, replacing the file if it exists."""
+
+    def dump_table(table: Table) -> None:
+        path.unlink(missing_ok=True)
+        module.dump(table, str(path), *args)
+
+    return dump_table
+
+
+def loader(module: Any, path: Path, args: Tuple[Any, ...]) -> Run:
+    """Makes a function that loads a file into a new table."""
+    return lambda _: module.load(Table(), str(path), *args)
+
+
+def page(path: Path) -> str:
+    """Renders a page of 50 rows from the middle of a CSV file, parsing only those rows."""
+    with LazyTable(str(path)) as lazy:
+        return str(lazy.view(len(lazy) // 2, len(lazy) // 2 + 50))
+
+
+def generic_deepcopy(table: Table) -> Table:
+    """Deep-copies a table without the `__deepcopy__` methods of tabling, for comparison."""
+    classes = (Element, Axis, Column, Cell, Category, Computed, Table)
+    methods = {kind: kind.__dict__["__deepcopy__"] for kind in classes}
+    for kind in classes:
+        delattr(kind, "__deepcopy__")
+    try:
+        return deepcopy(table)
+    finally:
+        for kind, method in methods.items():
+            setattr(kind, "__deepcopy__", method)
+
+
+def redirect(function: Callable[[], Any]) -> Any:
+    """Calls a function with its printed output discarded."""
+    with redirect_stdout(StringIO()):
+        return function()
+
+
+def measure(setup: Setup, run: Run, repeat: int) -> Dict[str, float]:
+    """Measures the best time of a benchmark and its peak memory."""
+    best = float("inf")
+    for _ in range(repeat):
+        subject = setup()
+        start = perf_counter()
+        run(subject)
+        best = min(best, perf_counter() - start)
+    subject = setup()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    run(subject)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": round(best, 6), "peak_kib": round(peak / 1024, 1)}
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], args: Namespace) -> int:
+    """Prints a comparison of results with a baseline and counts regressions."""
+    report = Table(colspacing=2)
+    report.add_row(("benchmark", "seconds", "baseline", "ratio", "peak KiB", "baseline", "ratio"))
+    regressions = 0
+    for name, result in results.items():
+        base = baseline.get(name, {})
+        time_ratio = result["seconds"] / base["seconds"] if base.get("seconds") else 0.0
+        slower = result["seconds"] - base.get("seconds", result["seconds"]) > NOISE_FLOOR
+        memory_ratio = result["peak_kib"] / base["peak_kib"] if base.get("peak_kib") else 0.0
+        report.add_row(
+            (
+                name,
+                f"{result['seconds']:.6f}",
+                f"{base['seconds']:.6f}" if base else "-",
+                f"{time_ratio:.2f}" if time_ratio else "-",
+                f"{result['peak_kib']:.1f}",
+                f"{base['peak_kib']:.1f}" if base else "-",
+                f"{memory_ratio:.2f}" if base else "-",
+            )
+        )
+        if (slower and time_ratio > args.time_threshold) or memory_ratio > args.memory_threshold:
+            report[-1].font.color = "red"
+            regressions += 1
+    report[0].font.style = "bold"
+    for row in report:
+        for cell in row[1:]:
+            cell.text.justify = "right"
+    print(report)
+    return regressions
+
+
+def parse_args() -> Namespace:
+    """Parses the command line arguments."""
+    parser = ArgumentParser(description="Benchmarks tabling.")
+    parser.add_argument("--sizes", default="1k", help=f"comma-separated sizes of {tuple(SIZES)}")
+    parser.add_argument("--only", default="*", help="glob pattern of benchmark names to run")
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs per benchmark")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="save results as the baseline")
+    parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD)
+    parser.add_argument("--memory-threshold", type=float, default=MEMORY_THRESHOLD)
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Runs the benchmarks and returns the exit status."""
+    args = parse_args()
+    results: Dict[str, Dict[str, float]] = {}
+    with TemporaryDirectory() as folder:
+        for size in args.sizes.split(","):
+            for styled in (False, True):
+                for name, setup, run in benchmarks(SIZES[size], styled, Path(folder)):
+                    key = f"{size}/{'styled' if styled else 'plain'}/{name}"
+                    if fnmatch(key, args.only):
+                        results[key] = measure(setup, run, args.repeat)
+                        print(key, results[key], file=sys.stderr)
+    baseline: Dict[str, Any] = {}
+    if args.baseline.exists():
+        with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+            baseline = load(baseline_file)
+    regressions = compare(results, baseline.get("results", {}), args)
+    if args.save:
+        baseline = {
+            "python": python_version(),
+            "platform": platform(),
+            "results": {**baseline.get("results", {}), **results},
+        }
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            dump(baseline, baseline_file, indent=2)
+        return 0
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
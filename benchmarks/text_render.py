@@ -0,0 +1,43 @@
+"""Microbenchmarks for each tier of `Text.render`."""
+
+import sys
+from pathlib import Path
+from timeit import repeat
+from typing import Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tabling.properties import Text  # pylint: disable=wrong-import-position
+
+LONG = " ".join(f"word{index % 97}" for index in range(20_000))
+
+
+def tiers() -> Dict[str, Callable[[], str]]:
+    """Gets a render call exercising each tier of `Text.render`."""
+    fits = Text("Wesley")
+    spaced = Text("Wesley Thomas", letter_spacing=1, word_spacing=2)
+    wrapped = Text("The quick brown fox jumps over the lazy dog " * 4)
+    huge = Text(LONG)
+    hidden = Text(LONG[:4096], visible=False)
+    wide = Text("日本語のテキスト" * 8)
+    return {
+        "fits": lambda: fits.render(12, -1),
+        "fits-unsized": lambda: fits.render(-1, -1),
+        "spacing": lambda: spaced.render(40, -1),
+        "textwrap": lambda: wrapped.render(20, -1),
+        "linear-wrap": lambda: huge.render(80, -1),
+        "hidden": lambda: hidden.render(80, -1),
+        "wide-wrap": lambda: wide.render(20, -1),
+    }
+
+
+def main() -> None:
+    """Prints the best time per call of each tier."""
+    for name, render in tiers().items():
+        number = 10 if name in ("linear-wrap", "hidden") else 10_000
+        best = min(repeat(render, number=number, repeat=5)) / number
+        print(f"{name:<14} {best * 1e6:>12.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Defines ANSI escape sequence helpers: `coalesce()`, `unstyle()`."""
+
+import re
+from typing import FrozenSet, List, NamedTuple, Optional, Tuple
+
+RESET = "\033[0m"
+"""Escape sequence that ends all styling."""
+
+SGR_RE = re.compile("\033\\[([0-9;]*)m")
+"""Pattern matching a Select Graphic Rendition (SGR) escape sequence."""
+
+COLOR_RE = re.compile("(38|48);2;\\d{1,3};\\d{1,3};\\d{1,3}")
+"""Pattern matching the parameters of a printly foreground or background color."""
+
+FONT_STYLE_CODES: FrozenSet[str] = frozenset(("1", "3", "4", "8", "9", "21", "53"))
+"""Parameters of printly font styles."""
+
+DECORATION_CODES: FrozenSet[str] = frozenset(("4", "9", "21", "53"))
+"""Parameters of font styles that are visible on spaces: underlines, strikethrough, overline."""
+
+
+class _State(NamedTuple):
+    fg: Optional[str] = None
+    bg: Optional[str] = None
+    fs: FrozenSet[str] = frozenset()
+
+    def codes(self) -> str:
+        """Generates the escape sequences that set this state from a reset terminal."""
+        codes = [f"\033[{self.fg}m"] if self.fg else []
+        if self.bg:
+            codes.append(f"\033[{self.bg}m")
+        codes.extend(f"\033[{code}m" for code in sorted(self.fs, key=int))
+        return "".join(codes)
+
+    def looks_blank_like(self, other: "_State") -> bool:
+        """Checks whether spaces look the same in this state as in another state."""
+        return self.bg == other.bg and self.fs & DECORATION_CODES == other.fs & DECORATION_CODES
+
+
+_PLAIN = _State()
+
+
+def unstyle(text: str) -> str:
+    """Removes every SGR escape sequence (`ESC[...m`) from text, without importing printly.
+
+    This strips the colors and font styles printly emits, as `printly.unstyle` does, and any other
+    SGR sequence too. Other escape sequences are left as they are.
+    """
+    return SGR_RE.sub("", text) if "\033" in text else text
+
+
+def coalesce(text: str) -> str:
+    """Rewrites styled text with the minimal escape sequences needed to display it.
+
+    Nested printly styles leave behind redundant reset/set pairs wherever one styled piece of text
+    ends and another begins. Each line is replayed as runs of characters sharing a style state and
+    only the changes between consecutive runs are emitted. Sequences stay in printly's format, so
+    `printly.unstyle` still strips the result; unknown escape sequences are passed through as is.
+    """
+    if "\033" not in text:
+        return text
+    return "\n".join(map(_coalesce_line, text.split("\n")))
+
+
+def _coalesce_line(line: str) -> str:
+    if "\033" not in line:
+        return line
+    output: List[str] = []
+    wanted = emitted = _PLAIN
+    opaque = False  # whether an unknown escape sequence left the terminal state unknown
+    position = 0
+    for match in SGR_RE.finditer(line):
+        if chunk := line[position : match.start()]:
+            emitted, opaque = _transition(output, chunk, emitted, wanted, opaque)
+            output.append(chunk)
+        position = match.end()
+        params = match.group(1)
+        if params in ("", "0"):
+            wanted = _PLAIN
+        elif params in FONT_STYLE_CODES:
+            wanted = wanted._replace(fs=wanted.fs | {params})
+        elif COLOR_RE.fullmatch(params) and params[0] == "3":
+            wanted = wanted._replace(fg=params)
+        elif COLOR_RE.fullmatch(params):
+            wanted = wanted._replace(bg=params)
+        else:
+            emitted, opaque = _transition(output, "", emitted, wanted, opaque)
+            output.append(match.group())
+            opaque = True
+    if chunk := line[position:]:
+        emitted, opaque = _transition(output, chunk, emitted, wanted, opaque)
+        output.append(chunk)
+    if emitted != _PLAIN:
+        output.append(RESET)
+    return "".join(output)
+
+
+def _transition(
+    output: List[str], chunk: str, emitted: _State, wanted: _State, opaque: bool
+) -> Tuple[_State, bool]:
+    """Appends the escape sequences that take the terminal from the emitted to the wanted state."""
+    if wanted == emitted:
+        return emitted, opaque
+    if not opaque and chunk and not chunk.strip(" ") and wanted.looks_blank_like(emitted):
+        return emitted, opaque
+    if (
+        (emitted.fg and not wanted.fg)
+        or (emitted.bg and not wanted.bg)
+        or not emitted.fs <= wanted.fs
+    ):
+        output.append(RESET + wanted.codes())
+        return wanted, False
+    if wanted.fg != emitted.fg:
+        output.append(f"\033[{wanted.fg}m")
+    if wanted.bg != emitted.bg:
+        output.append(f"\033[{wanted.bg}m")
+    output.extend(f"\033[{code}m" for code in sorted(wanted.fs - emitted.fs, key=int))
+    return wanted, opaque
@@ -1,6 +1,18 @@
 """Defines the `Axis` class."""
 
-from typing import Iterator, List, Self, Union
+from collections import deque
+from copy import deepcopy
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Self,
+    Tuple,
+    Union,
+)
 from .cell import Cell
 from .element import Element
 
@@ -10,7 +22,7 @@ class Axis(Element):
 
     def __init__(self: Self, cellspacing: int = 0) -> None:
         super().__init__()
-        self._cells: List[Cell] = []
+        self._cells: MutableSequence[Cell] = []
         self.cellspacing: int = cellspacing
 
     def __bool__(self: Self) -> bool:
@@ -24,12 +36,24 @@ class Axis(Element):
 
     def __getitem__(self: Self, index: Union[int, slice]):
         if isinstance(index, slice):
-            return self._cells[index.start or 0 : index.stop or len(self._cells) : index.step or 1]
+            cells = self._cells if isinstance(self._cells, list) else list(self._cells)
+            return cells[index.start or 0 : index.stop or len(cells) : index.step or 1]
         try:
             return self._cells[index]
         except IndexError as exc:
             raise IndexError(f"Cell index {index} is out of range.") from exc
 
+    def __copy__(self: Self) -> Self:
+        axis = self.__class__.__new__(self.__class__)
+        axis.__dict__.update(self.__dict__)
+        axis._cells = self._cells.copy()  # type: ignore
+        return axis
+
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> Self:
+        axis = super().__deepcopy__(memo)
+        axis._cells = type(self._cells)(deepcopy(cell, memo) for cell in self._cells)  # type: ignore
+        return axis
+
     def __contains__(self: Self, cell: Cell) -> bool:
         return cell in self._cells
 
@@ -42,6 +66,10 @@ class Axis(Element):
         """Adds a cell."""
         self._cells.append(cell)
 
+    def extend(self: Self, cells: Iterable[Cell]) -> None:
+        """Adds many cells."""
+        self._cells.extend(cells)
+
     def insert(self: Self, index: int, cell: Cell) -> None:
         """Inserts a cell."""
         self._cells.insert(index, cell)
@@ -52,6 +80,33 @@ class Axis(Element):
             raise ValueError(f"Cell {cell} not found in this axis.")
         self._cells.remove(cell)
 
+    def pop(self: Self, index: int = -1) -> Cell:
+        """Removes a cell by position and returns it."""
+        try:
+            cell = self._cells[index]
+        except IndexError as exc:
+            raise IndexError(f"Cell index {index} is out of range.") from exc
+        del self._cells[index]
+        return cell
+
+    def delete(self: Self, indices: AbstractSet[int]) -> None:
+        """Removes cells at the given non-negative positions in one pass."""
+        cells = [cell for index, cell in enumerate(self._cells) if index not in indices]
+        self._cells = cells if isinstance(self._cells, list) else deque(cells)
+
+    def permute(self: Self, order: Iterable[int]) -> None:
+        """Reorders cells so that the cell at position `order[i]` moves to position `i`."""
+        cells = self._cells if isinstance(self._cells, list) else list(self._cells)
+        permuted = [cells[index] for index in order]
+        self._cells = permuted if isinstance(self._cells, list) else deque(permuted)
+
+    def use_deque(self: Self) -> None:
+        """Stores cells in a deque, so that removing the first cells takes constant time."""
+        self._cells = deque(self._cells)
+
+    def render_key(self: Self) -> Tuple[Any, ...]:
+        return (*super().render_key(), self.cellspacing, *(cell.render_key() for cell in self))
+
     def swap(self: Self, i: int, j: int) -> None:
         """Swaps cells."""
         self._cells[i], self._cells[j] = self._cells[j], self._cells[i]
@@ -1,9 +1,16 @@
 """Defines the `Cell` class."""
 
-from typing import Any, Self
-from printly import unstyle
+from copy import deepcopy
+from datetime import date, datetime, time
+from typing import Any, Dict, List, Optional, Self, Tuple
+from .computed import Computed
+from .dtype import Category
 from .element import Element
 from .properties import Text
+from .width import display_width
+
+IMMUTABLE = frozenset((type(None), bool, int, float, complex, str, bytes, date, datetime, time))
+"""Types of values that copies of cells share with the original cells."""
 
 
 class Cell(Element):
@@ -13,26 +20,64 @@ class Cell(Element):
         super().__init__()
         self.text: Text = Text(value)
         self._width = self._height = -1
+        self._dependents: Optional[List[Computed]] = None
 
     def __str__(self: Self) -> str:
         text = self._rendered_text
         text = self.font.apply(text)
         return self._render(text)
 
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> Self:
+        cell = super().__deepcopy__(memo)
+        cell._dependents = None  # copied values computed from this cell register on the copy
+        cell.text = self.text.copy()
+        if type(value := self.text.text) not in IMMUTABLE:
+            cell.text.text = deepcopy(value, memo)
+        if self._dependents:
+            for dependent in deepcopy(self._dependents, memo):
+                cell.add_dependent(dependent)
+        return cell
+
     @property
     def value(self: Self) -> Any:
         """Gets the cell value."""
-        return self.text.text
+        value = self.text.text
+        return value.value if isinstance(value, (Category, Computed)) else value
 
     @value.setter
     def value(self: Self, value: Any) -> None:
         self.text.text = value
+        self.invalidate_dependents()
+
+    def render_key(self: Self) -> Tuple[Any, ...]:
+        text, value = self.text, self.value
+        return (
+            *super().render_key(),
+            value.__class__,
+            value,
+            *text.render_key(),
+            self._width,
+            self._height,
+        )
+
+    def add_dependent(self: Self, dependent: Computed) -> None:
+        """Recomputes a computed value whenever this cell gets a new value."""
+        if self._dependents is None:
+            self._dependents = [dependent]
+        elif dependent not in self._dependents:
+            self._dependents.append(dependent)
+
+    def invalidate_dependents(self: Self) -> None:
+        """Marks the values computed from this cell for recomputation."""
+        if self._dependents:
+            for dependent in self._dependents:
+                dependent.invalidate()
 
     @property
     def width(self: Self) -> int:
         """Gets the cell width."""
         if self._width == -1:
-            return max(map(len, map(unstyle, self._rendered_text.split("\n"))))
+            return max(map(display_width, self._rendered_text.split("\n")))
         return self._width
 
     @width.setter
@@ -1,36 +1,81 @@
 """Defines the `Column` class."""
 
 from copy import deepcopy
-from typing import Self
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Self
 from .axis import Axis
+from .dtype import Category, DType
+from .layout import Widths
+from .profiling import instrumented, phase
 
 
 class Column(Axis):
     """Represents a table column."""
 
+    def __init__(self: Self, cellspacing: int = 0) -> None:
+        super().__init__(cellspacing)
+        self.dtype: Optional[DType] = None
+        self.format_spec: str = ""
+        self.function: Optional[Callable[[Mapping], Any]] = None
+        self.categories: List[Category] = []
+
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> Self:
+        column = super().__deepcopy__(memo)
+        column.categories = [deepcopy(category, memo) for category in self.categories]
+        return column
+
     def __str__(self: Self) -> str:
         if self.preserve:
-            self = deepcopy(self)  # pylint: disable=self-cls-assignment
+            with phase("copy"):
+                self = deepcopy(self)  # pylint: disable=self-cls-assignment
         self.normalize()
         return self._render(("\n" + "\n" * self.cellspacing).join(map(str, self._cells)))
 
-    def normalize(self: Self) -> None:
-        """Sets uniform, fixed spacing values to cells."""
+    def measure(self: Self) -> Widths:
+        """Gets the distribution of the widths of the cells, as `normalize()` would lay them out."""
+        natural = total = 0
+        chrome = [0, 0, 0, 0, 0, 0]  # margins, paddings and borders, left and right
+        for cell in self._cells:
+            if self.format_spec and not isinstance(cell.value, str):
+                cell.text.format_spec = self.format_spec
+            natural = max(natural, width := cell.width)
+            total += width
+            sides = (
+                cell.margin.left,
+                cell.margin.right,
+                cell.padding.left,
+                cell.padding.right,
+                bool(cell.border.left.style),
+                bool(cell.border.right.style),
+            )
+            chrome = list(map(max, chrome, sides))
+        return Widths(natural, total, len(self._cells), sum(chrome))
+
+    @instrumented("normalize")
+    def normalize(self: Self, width: Optional[int] = None) -> None:
+        """Sets uniform, fixed spacing values to cells, and a given width instead of the widest."""
         max_margin_left = max_margin_right = max_padding_left = max_padding_right = max_width = 0
         any_left_border = any_right_border = False
         for cell in self._cells:
+            if self.format_spec and not isinstance(cell.value, str):
+                cell.text.format_spec = self.format_spec
             max_margin_left = max(max_margin_left, cell.margin.left)
             max_margin_right = max(max_margin_right, cell.margin.right)
             max_padding_left = max(max_padding_left, cell.padding.left)
             max_padding_right = max(max_padding_right, cell.padding.right)
-            max_width = max(max_width, cell.width)
+            if width is None:
+                max_width = max(max_width, cell.width)
             any_left_border = any_left_border or bool(cell.border.left.style)
             any_right_border = any_right_border or bool(cell.border.right.style)
+        if width is not None:
+            max_width = width
+        inherit = bool(self.font.style or self.font.color)
         for cell in self._cells:
             cell.margin.inline = max_margin_left, max_margin_right
             cell.padding.inline = max_padding_left, max_padding_right
             cell.width = max_width
-            cell.font += self.font
+            if inherit:
+                cell.font += self.font
             if any_left_border and not cell.border.left.style:
                 cell.padding.left += 1
             if any_right_border and not cell.border.right.style:
@@ -0,0 +1,93 @@
+"""Defines the `Computed` class."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Self
+
+if TYPE_CHECKING:
+    from .cell import Cell
+    from .row import Row
+
+
+class Computed:
+    """Represents the value of a computed cell: a function of the other values in its row.
+
+    The value is computed when it is first read, e.g. when rendering or exporting, and memoized
+    until a cell it was computed from gets a new value through `Cell.value`.
+    """
+
+    __slots__ = ("function", "row", "header", "cell", "stale", "sources", "_value")
+
+    def __init__(
+        self: Self, function: Callable[[Mapping], Any], row: Row, header: Row, cell: Cell
+    ) -> None:
+        self.function = function
+        self.row = row
+        self.header = header
+        self.cell = cell
+        self.stale = True
+        self.sources: List[Cell] = []
+        self._value: Any = None
+
+    def __str__(self: Self) -> str:
+        return f"{self.value}"
+
+    def __repr__(self: Self) -> str:
+        return f"Computed({self.function!r})"
+
+    def __format__(self: Self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> "Computed":
+        # compute in the original before copying, as tables are copied to be rendered
+        self.value  # pylint: disable=pointless-statement
+        copy = Computed.__new__(Computed)
+        memo[id(self)] = copy
+        for name in self.__slots__:
+            setattr(copy, name, deepcopy(getattr(self, name), memo))
+        for source in copy.sources:  # in case the source was copied before the value was computed
+            source.add_dependent(copy)
+        return copy
+
+    @property
+    def value(self: Self) -> Any:
+        """Gets the value, computing it if a source value changed since it was last computed."""
+        if self.stale:
+            self.sources = []
+            self._value = self.function(_RowMapping(self))
+            self.stale = False
+        return self._value
+
+    def invalidate(self: Self) -> None:
+        """Marks the value for recomputation, along with the values computed from it."""
+        if not self.stale:
+            self.stale = True
+            self.cell.invalidate_dependents()
+
+
+class _RowMapping(Mapping):
+    """Maps the header values of a table to the values of a row, recording what is read."""
+
+    def __init__(self: Self, computed: Computed) -> None:
+        self._computed = computed
+        self._names: Optional[Dict[Any, int]] = None
+
+    def __getitem__(self: Self, name: Any) -> Any:
+        if self._names is None:
+            self._names = {}
+            for index, cell in enumerate(self._computed.header):
+                self._names.setdefault(cell.value, index)
+        if name not in self._names:
+            raise KeyError(f"No column {name!r} found in the table header.")
+        cell = self._computed.row[self._names[name]]
+        cell.add_dependent(self._computed)
+        self._computed.sources.append(cell)
+        return cell.value
+
+    def __iter__(self: Self) -> Iterator[Any]:
+        return (cell.value for cell in self._computed.header)
+
+    def __len__(self: Self) -> int:
+        return len(self._computed.header)
@@ -0,0 +1,137 @@
+"""Defines column data types: `Category`, `fits()`, `infer()`, `parse()`."""
+
+from copy import deepcopy
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Literal, Self, Tuple, TypeAlias, Union
+
+DType: TypeAlias = Union[str, Literal["int", "float", "bool", "date", "str", "category"]]
+
+BOOLEANS = {"true": True, "false": False}
+"""Text parsed as booleans, compared case-insensitively."""
+
+
+def _int(value: Any) -> int:
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{value!r} is not an integer.")
+    return int(value)
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, str):
+        if (lowered := value.lower()) not in BOOLEANS:
+            raise ValueError(f"{value!r} is not a boolean.")
+        return BOOLEANS[lowered]
+    if value not in (0, 1):
+        raise ValueError(f"{value!r} is not a boolean.")
+    return bool(value)
+
+
+def _date(value: Any) -> date:
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f"{value!r} is not a date.")
+    return date.fromisoformat(value)
+
+
+PARSERS: Dict[str, Callable[[Any], Any]] = {
+    "int": _int,
+    "float": float,
+    "bool": _bool,
+    "date": _date,
+    "str": str,
+    "category": lambda value: value,
+}
+"""Value parsers by data type."""
+
+TYPES: Dict[str, Union[type, tuple]] = {
+    "int": int,
+    "float": (int, float),
+    "bool": bool,
+    "date": date,
+    "str": str,
+    "category": object,
+}
+"""Python types of the values of each data type."""
+
+
+class Category:
+    """Represents a distinct value of a categorical column, shared by every cell holding it.
+
+    Changing the value changes it in all those cells at once. Rendered text is cached per width
+    and text attributes, so each distinct value is rendered once rather than once per row.
+    """
+
+    __slots__ = ("_value", "renders")
+
+    def __init__(self: Self, value: Any) -> None:
+        self._value = value
+        self.renders: Dict[Tuple, str] = {}
+
+    def __str__(self: Self) -> str:
+        return f"{self._value}"
+
+    def __repr__(self: Self) -> str:
+        return f"Category({self._value!r})"
+
+    def __format__(self: Self, format_spec: str) -> str:
+        return format(self._value, format_spec)
+
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> "Category":
+        # copies share rendered text until either value changes, e.g. while tables are rendered
+        category = Category.__new__(Category)
+        memo[id(self)] = category
+        category._value = deepcopy(self._value, memo)
+        category.renders = self.renders
+        return category
+
+    @property
+    def value(self: Self) -> Any:
+        """Gets the value."""
+        return self._value
+
+    @value.setter
+    def value(self: Self, value: Any) -> None:
+        self._value = value
+        self.renders = {}
+
+
+def parse(value: Any, dtype: DType) -> Any:
+    """Converts a value to a data type, leaving empty values (`None` or `""`) as they are."""
+    if dtype not in PARSERS:
+        raise ValueError(f"Invalid dtype {dtype!r}. Expected one of {tuple(PARSERS)}")
+    if value is None or value == "":
+        return value
+    try:
+        return PARSERS[dtype](value.strip() if isinstance(value, str) else value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid {dtype} value {value!r}.") from exc
+
+
+def infer(values: Iterable[Any]) -> DType:
+    """Gets the narrowest data type that every non-empty value can be parsed as."""
+    candidates: List[DType] = ["int", "float", "bool", "date"]
+    empty = True
+    for value in values:
+        if value is None or value == "":
+            continue
+        empty = False
+        candidates = [dtype for dtype in candidates if _parses(value, dtype)]
+        if not candidates:
+            return "str"
+    return "str" if empty else candidates[0]
+
+
+def fits(value: Any, dtype: DType) -> bool:
+    """Gets whether a value is of a data type, e.g. not a header left as text in a typed column."""
+    return isinstance(value, TYPES[dtype]) and (dtype == "bool") == isinstance(value, bool)
+
+
+def _parses(value: Any, dtype: DType) -> bool:
+    if not isinstance(value, str):
+        return fits(value, dtype)
+    try:
+        PARSERS[dtype](value.strip())
+    except (TypeError, ValueError):
+        return False
+    return True
@@ -1,6 +1,7 @@
 """Defines the `Element` class."""
 
-from typing import Self
+from copy import deepcopy
+from typing import Any, Dict, Self, Tuple
 from .properties import Background, Border, Font, Margin, Padding
 
 
@@ -15,6 +16,42 @@ class Element:  # pylint: disable=too-few-public-methods
         self.padding: Padding = Padding(left=0, right=0, top=0, bottom=0)
         self.preserve: bool = True
 
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> Self:
+        element = self.__class__.__new__(self.__class__)
+        memo[id(self)] = element
+        element.__dict__.update(self.__dict__)
+        element.background = self.background.copy()
+        element.border = self.border.copy()
+        element.font = self.font.copy()
+        element.margin = self.margin.copy()
+        element.padding = self.padding.copy()
+        return element
+
+    def copy(self: Self) -> Self:
+        """Copies the element, sharing only immutable values with it."""
+        return deepcopy(self)
+
+    def render_key(self: Self) -> Tuple[Any, ...]:
+        """Gets a key that is equal for two states of the element only if they render the same."""
+        border, margin, padding = self.border, self.margin, self.padding
+        return (
+            self.background.color,
+            self.font.style,
+            self.font.color,
+            *(
+                (s.style, s.color, s.char)
+                for s in (border.left, border.right, border.top, border.bottom)
+            ),
+            margin.left,
+            margin.right,
+            margin.top,
+            margin.bottom,
+            padding.left,
+            padding.right,
+            padding.top,
+            padding.bottom,
+        )
+
     def _render(self: Self, text: str) -> str:
         """Generates a visual representation of the element."""
         text = self.padding.apply(text)
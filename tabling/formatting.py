@@ -0,0 +1,225 @@
+"""Defines conditional formats: `Style`, `Format`, `Threshold`, `Heatmap`, `TopK`."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from functools import lru_cache
+from heapq import nlargest, nsmallest
+from math import isfinite, isnan, nan
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Self, Sequence, Tuple
+from .properties import Background, Font
+
+if TYPE_CHECKING:
+    from printly.types import Color, FontStyle
+
+
+class Style(NamedTuple):
+    """Represents the style given to the cells selected by a conditional format."""
+
+    background: Optional[Color] = None
+    font_style: Optional[FontStyle] = None
+    font_color: Optional[Color] = None
+
+
+class Format:
+    """Represents the conditional formatting of a column: styles chosen for cells by their value.
+
+    Only numbers are styled, so text columns should be typed first, e.g. with `set_dtype()`. Styles
+    come from a small palette shared by the cells, and are chosen for all the values of the column
+    at once, with NumPy when it is installed. Choices are kept between renders, and only changed
+    values are styled again unless the change moves a bound such as the largest value.
+    """
+
+    def __init__(self: Self, column: int, start: int = 1) -> None:
+        self.column: int = column
+        self.start: int = start
+        self._numbers: List[float] = []
+        self._bound: Any = None
+        self._indices: List[int] = []
+
+    @property
+    def palette(self: Self) -> List[Tuple[Font, Background]]:
+        """Gets the fonts and backgrounds of the styles, by index."""
+        raise NotImplementedError
+
+    def indices(self: Self, values: Sequence[Any]) -> List[int]:
+        """Gets the palette index of the style of each value, -1 for values left unstyled."""
+        numbers = [float(value) if type(value) in (int, float) else nan for value in values]
+        bound = self._get_bound(numbers)
+        if bound != self._bound or len(numbers) != len(self._numbers):
+            self._indices = self._classify(numbers, bound)
+        else:
+            old = self._numbers
+            # nan != nan, so unstyled values are styled again as well
+            changed = [index for index, number in enumerate(numbers) if number != old[index]]
+            if changed:
+                indices = self._classify([numbers[index] for index in changed], bound)
+                for index, style in zip(changed, indices):
+                    self._indices[index] = style
+        self._numbers, self._bound = numbers, bound
+        return self._indices
+
+    def _get_bound(self: Self, numbers: List[float]) -> Any:
+        """Gets what the style of a value depends on besides the value, e.g. the largest value."""
+        raise NotImplementedError
+
+    def _classify(self: Self, numbers: List[float], bound: Any) -> List[int]:
+        """Gets the palette index of the style of each number, -1 for `nan`."""
+        raise NotImplementedError
+
+
+class Threshold(Format):
+    """Represents styles chosen by thresholds: values under `bounds[0]` get `styles[0]`, values from
+    `bounds[i - 1]` and under `bounds[i]` get `styles[i]`, and the rest get `styles[-1]`.
+    """
+
+    def __init__(
+        self: Self,
+        column: int,
+        bounds: Sequence[float],
+        styles: Sequence[Optional[Style]],
+        start: int = 1,
+    ) -> None:
+        super().__init__(column, start)
+        if len(styles) != len(bounds) + 1:
+            raise ValueError(f"Invalid number of styles {len(styles)}. Must be {len(bounds) + 1}.")
+        if list(bounds) != sorted(bounds):
+            raise ValueError(f"Invalid bounds {bounds!r}. Must be in ascending order.")
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        self.styles: Tuple[Optional[Style], ...] = tuple(styles)
+
+    @property
+    def palette(self: Self) -> List[Tuple[Font, Background]]:
+        return [_resolve(style) for style in self.styles if style is not None]
+
+    def _get_bound(self: Self, numbers: List[float]) -> Any:
+        return self.bounds, self.styles
+
+    def _classify(self: Self, numbers: List[float], bound: Any) -> List[int]:
+        lookup, index = [], 0
+        for style in self.styles:
+            lookup.append(-1 if style is None else index)
+            index += style is not None
+        if (numpy := _numpy()) is not None:
+            array = numpy.array(numbers)
+            bins = numpy.array(lookup)[numpy.searchsorted(self.bounds, array, side="right")]
+            return numpy.where(numpy.isnan(array), -1, bins).tolist()
+        bounds = self.bounds
+        return [lookup[bisect_right(bounds, x)] if not isnan(x) else -1 for x in numbers]
+
+
+class Heatmap(Format):
+    """Represents backgrounds graded in `steps` colors from `low`, for the smallest value, to
+    `high`, for the largest value.
+
+    Infinite values are left unstyled.
+    """
+
+    def __init__(
+        self: Self, column: int, low: Color, high: Color, steps: int = 8, start: int = 1
+    ) -> None:
+        super().__init__(column, start)
+        if steps < 2:
+            raise ValueError(f"Invalid number of heatmap steps {steps}. Must be >= 2.")
+        self.low: Color = low
+        self.high: Color = high
+        self.steps: int = steps
+
+    @property
+    def palette(self: Self) -> List[Tuple[Font, Background]]:
+        return [_resolve(Style(background=color)) for color in self._colors()]
+
+    def _colors(self: Self) -> List[str]:
+        from printly.style import get_rgb_values  # pylint: disable=import-outside-toplevel
+
+        low, high, last = get_rgb_values(self.low), get_rgb_values(self.high), self.steps - 1
+        return [
+            "#" + "".join(f"{round(a + (b - a) * step / last):02x}" for a, b in zip(low, high))
+            for step in range(self.steps)
+        ]
+
+    def _get_bound(self: Self, numbers: List[float]) -> Any:
+        if (numpy := _numpy()) is not None:
+            array = numpy.array(numbers)
+            valid = array[numpy.isfinite(array)]
+            if not valid.size:
+                return None
+            return float(valid.min()), float(valid.max()), self.steps
+        valid = [x for x in numbers if isfinite(x)]
+        return (min(valid), max(valid), self.steps) if valid else None
+
+    def _classify(self: Self, numbers: List[float], bound: Any) -> List[int]:
+        if bound is None:
+            return [-1] * len(numbers)
+        low, high, steps = bound
+        scale = (steps - 1) / (high - low) if high > low else 0.0
+        if (numpy := _numpy()) is not None:
+            array = numpy.array(numbers)
+            finite = numpy.isfinite(array)
+            steps_array = numpy.floor((numpy.where(finite, array, low) - low) * scale + 0.5)
+            return numpy.where(finite, steps_array, -1).astype(int).tolist()
+        return [int((x - low) * scale + 0.5) if isfinite(x) else -1 for x in numbers]
+
+
+class TopK(Format):
+    """Represents a style given to the `k` largest values, or smallest values if not `largest`.
+
+    Values equal to the `k`th largest or smallest value are styled too.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self: Self, column: int, k: int, style: Style, largest: bool = True, start: int = 1
+    ) -> None:
+        super().__init__(column, start)
+        if k < 1:
+            raise ValueError(f"Invalid number of values {k}. Must be >= 1.")
+        self.k: int = k
+        self.style: Style = style
+        self.largest: bool = largest
+
+    @property
+    def palette(self: Self) -> List[Tuple[Font, Background]]:
+        return [_resolve(self.style)]
+
+    def _get_bound(self: Self, numbers: List[float]) -> Any:
+        if (numpy := _numpy()) is not None:
+            array = numpy.array(numbers)
+            valid = array[~numpy.isnan(array)]
+            if not valid.size:
+                return None
+            k = min(self.k, valid.size)
+            kth = (
+                numpy.partition(valid, -k)[-k]
+                if self.largest
+                else numpy.partition(valid, k - 1)[k - 1]
+            )
+            return float(kth), self.largest
+        valid = [x for x in numbers if not isnan(x)]
+        if not valid:
+            return None
+        return (nlargest if self.largest else nsmallest)(self.k, valid)[-1], self.largest
+
+    def _classify(self: Self, numbers: List[float], bound: Any) -> List[int]:
+        if bound is None:
+            return [-1] * len(numbers)
+        kth, largest = bound
+        if (numpy := _numpy()) is not None:
+            array = numpy.array(numbers)
+            selected = array >= kth if largest else array <= kth  # comparisons with nan are false
+            return numpy.where(selected, 0, -1).tolist()
+        if largest:
+            return [0 if x >= kth else -1 for x in numbers]
+        return [0 if x <= kth else -1 for x in numbers]
+
+
+def _resolve(style: Style) -> Tuple[Font, Background]:
+    return Font(style=style.font_style, color=style.font_color), Background(color=style.background)
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    try:
+        import numpy  # type: ignore  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numpy
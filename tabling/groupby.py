@@ -0,0 +1,262 @@
+"""Defines the `GroupBy` class and the `pivot()` function."""
+
+from typing import Any, Callable, Dict, Iterator, List, Literal, Self, Tuple, TypeAlias, Union
+from .table import Table
+
+Aggregate: TypeAlias = Union[
+    str,
+    Literal["count", "sum", "mean", "min", "max", "first", "last"],
+    Callable[[List[Any]], Any],
+]
+
+
+class GroupBy:  # pylint: disable=too-few-public-methods
+    """Represents the rows of a table grouped by equal values in key columns.
+
+    The first row of the table is its header, and columns are named by header values.
+    """
+
+    def __init__(self: Self, table: Table, keys: Any) -> None:
+        self.table: Table = table
+        self.keys: List[Any] = _names(keys)
+
+    def agg(  # pylint: disable=too-many-locals
+        self: Self, aggregates: Dict[Any, Union[Aggregate, List[Aggregate]]]
+    ) -> Table:
+        """Aggregates columns per group into a new table with one row per group.
+
+        `aggregates` maps column names to an aggregate or a list of aggregates: `count`, `sum`,
+        `mean`, `min`, `max`, `first`, `last` or a function of the list of values. Empty values are
+        skipped. Result columns are named after their column, or `<column>_<aggregate>` for lists.
+        """
+        header = _header(self.table)
+        names, indices, factories = list(self.keys), [], []
+        for name, functions in aggregates.items():
+            index = _get_key(header, name)
+            for function in functions if isinstance(functions, list) else [functions]:
+                indices.append(index)
+                factories.append(_factory(function))
+                names.append(f"{name}_{_name(function)}" if isinstance(functions, list) else name)
+        groups: Dict[Tuple, List[_Accumulator]] = {}
+        width = len(self.keys)
+        for values in _rows(self.table, [_get_key(header, key) for key in self.keys] + indices):
+            if (accumulators := groups.get(key := values[:width])) is None:
+                accumulators = groups[key] = [factory() for factory in factories]
+            for accumulator, value in zip(accumulators, values[width:]):
+                if value is not None and value != "":
+                    accumulator.add(value)
+        rows: List[List[Any]] = [names]
+        rows.extend([*key, *(acc.result() for acc in accs)] for key, accs in groups.items())
+        return _table(self.table, rows)
+
+
+def pivot(  # pylint: disable=too-many-arguments, too-many-locals
+    table: Table, index: Any, columns: Any, values: Any, aggfunc: Aggregate = "sum"
+) -> Table:
+    """Aggregates the values of a column into a new table, by index and column values.
+
+    The result has one row per distinct value of the index columns and one column per distinct
+    value of the `columns` column, in the order they first appear. Combinations that are missing or
+    have only empty values are empty.
+    """
+    header = _header(table)
+    keys, factory = _names(index), _factory(aggfunc)
+    indices = [_get_key(header, key) for key in keys]
+    indices += [_get_key(header, columns), _get_key(header, values)]
+    width = len(keys)
+    labels: Dict[Any, None] = {}
+    groups: Dict[Tuple, Dict[Any, _Accumulator]] = {}
+    for row in _rows(table, indices):
+        label, value = row[width], row[width + 1]
+        labels.setdefault(label)
+        if (group := groups.get(key := row[:width])) is None:
+            group = groups[key] = {}
+        if value is None or value == "":
+            continue  # combinations without values are left empty, like missing ones
+        if (accumulator := group.get(label)) is None:
+            accumulator = group[label] = factory()
+        accumulator.add(value)
+    rows: List[List[Any]] = [[*keys, *labels]]
+    for key, group in groups.items():
+        rows.append([*key, *(group[label].result() if label in group else "" for label in labels)])
+    return _table(table, rows)
+
+
+def number(value: Any) -> Union[int, float]:
+    """Converts a cell value to a number, parsing text such as `"42"` or `"3.14"`."""
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Cannot aggregate non-numeric value {value!r}.") from exc
+
+
+class _Accumulator:
+    __slots__ = ()
+
+    def add(self: Self, value: Any) -> None:
+        """Adds a value."""
+        raise NotImplementedError
+
+    def result(self: Self) -> Any:
+        """Gets the aggregate of the added values."""
+        raise NotImplementedError
+
+
+class _Count(_Accumulator):
+    __slots__ = ("count",)
+
+    def __init__(self: Self) -> None:
+        self.count = 0
+
+    def add(self: Self, value: Any) -> None:
+        self.count += 1
+
+    def result(self: Self) -> Any:
+        return self.count
+
+
+class _Sum(_Accumulator):
+    """Adds numbers with Neumaier compensation, so float totals don't drift with row count."""
+
+    __slots__ = ("total", "error", "count")
+
+    def __init__(self: Self) -> None:
+        self.total: Union[int, float] = 0
+        self.error: Union[int, float] = 0
+        self.count = 0
+
+    def add(self: Self, value: Any) -> None:
+        value = number(value)
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.error += (self.total - total) + value
+        else:
+            self.error += (value - total) + self.total
+        self.total = total
+        self.count += 1
+
+    def result(self: Self) -> Any:
+        return self.total + self.error
+
+
+class _Mean(_Sum):
+    __slots__ = ()
+
+    def result(self: Self) -> Any:
+        return super().result() / self.count if self.count else ""
+
+
+class _Extreme(_Accumulator):
+    """Keeps the smallest or largest value, compared as a number when it is numeric.
+
+    Numbers rank before text, which is compared as a string.
+    """
+
+    __slots__ = ("value", "order", "sign")
+
+    def __init__(self: Self, sign: int) -> None:
+        self.value: Any = ""
+        self.order: Any = None
+        self.sign = sign
+
+    def add(self: Self, value: Any) -> None:
+        try:
+            order: Tuple[int, Any] = (0, number(value))
+        except ValueError:
+            order = (1, f"{value}")
+        if self.order is None or (order < self.order if self.sign < 0 else order > self.order):
+            self.value, self.order = value, order
+
+    def result(self: Self) -> Any:
+        return self.value
+
+
+class _First(_Accumulator):
+    __slots__ = ("value",)
+
+    def __init__(self: Self) -> None:
+        self.value: Any = ""
+
+    def add(self: Self, value: Any) -> None:
+        if self.value == "":
+            self.value = value
+
+    def result(self: Self) -> Any:
+        return self.value
+
+
+class _Last(_First):
+    __slots__ = ()
+
+    def add(self: Self, value: Any) -> None:
+        self.value = value
+
+
+class _Collect(_Accumulator):
+    __slots__ = ("values", "function")
+
+    def __init__(self: Self, function: Callable[[List[Any]], Any]) -> None:
+        self.values: List[Any] = []
+        self.function = function
+
+    def add(self: Self, value: Any) -> None:
+        self.values.append(value)
+
+    def result(self: Self) -> Any:
+        return self.function(self.values)
+
+
+AGGREGATES: Dict[str, Callable[[], _Accumulator]] = {
+    "count": _Count,
+    "sum": _Sum,
+    "mean": _Mean,
+    "min": lambda: _Extreme(-1),
+    "max": lambda: _Extreme(1),
+    "first": _First,
+    "last": _Last,
+}
+"""Accumulator factories of the named aggregates."""
+
+
+def _factory(function: Aggregate) -> Callable[[], _Accumulator]:
+    if callable(function):
+        return lambda: _Collect(function)  # type: ignore
+    if function not in AGGREGATES:
+        raise ValueError(
+            f"Invalid aggregate {function!r}. Expected one of {tuple(AGGREGATES)} or a function."
+        )
+    return AGGREGATES[function]
+
+
+def _name(function: Aggregate) -> str:
+    return function if isinstance(function, str) else getattr(function, "__name__", "agg")
+
+
+def _names(names: Any) -> List[Any]:
+    return list(names) if isinstance(names, (list, tuple)) else [names]
+
+
+def _header(table: Table) -> List[Any]:
+    return [cell.value for cell in table[0]] if table else []
+
+
+def _get_key(header: List[Any], name: Any) -> int:
+    return Table._get_key(header, name)  # pylint: disable=protected-access
+
+
+def _rows(table: Table, indices: List[int]) -> Iterator[Tuple[Any, ...]]:
+    columns = table._columns  # pylint: disable=protected-access
+    values = [[cell.value for cell in columns[index]][1:] for index in indices]
+    return zip(*values)
+
+
+def _table(table: Table, rows: List[List[Any]]) -> Table:
+    result = Table(table.colspacing, table.rowspacing)
+    result.add_rows(rows)
+    return result
@@ -1,10 +1,44 @@
-"""Defines classes for table IO operations."""
-
-from .csv import csv
-from .html import html
-from .json import json
-from .md import md
-from .sqlite import sqlite
-from .tsv import tsv
-from .txt import txt
-from .xlsx import xlsx
+"""Defines classes for table IO operations.
+
+Formats are imported on first access, so importing this package does not import `sqlite3`,
+`csv`, `json` or printly.
+"""
+
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .csv import csv
+    from .html import html
+    from .json import json
+    from .md import md
+    from .sqlite import sqlite
+    from .tbl import tbl
+    from .tsv import tsv
+    from .txt import txt
+    from .xlsx import xlsx
+
+__all__ = ["csv", "html", "json", "md", "sqlite", "tbl", "tsv", "txt", "xlsx"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        return getattr(import_module(f".{name}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(ModuleType):  # pylint: disable=too-few-public-methods
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a format module binds it on this package; expose its class instead.
+        if name in __all__ and isinstance(value, ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
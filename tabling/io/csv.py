@@ -1,23 +1,41 @@
 """Defines the `csv` class."""
 
 from csv import reader, writer
+from os import PathLike, fspath
+from typing import Optional
+from ..profiling import instrumented_io
 from ..table import Table
+from .parallel import load as load_parallel
+from .stream import File, compression, open_text
 
 
 class csv:  # pylint: disable=invalid-name
     """Represents CSV io operations."""
 
     @staticmethod
-    def dump(table: Table, filepath: str) -> None:
-        """Dumps a table to a CSV file."""
-        with open(filepath, "w", encoding="utf-8", newline="") as csv_file:
+    @instrumented_io("csv.dump")
+    def dump(table: Table, filepath: File, compresslevel: Optional[int] = None) -> None:
+        """Dumps a table to a CSV file, compressed if named `*.gz`, `*.bz2` or `*.xz`."""
+        with open_text(filepath, "w", newline="", compresslevel=compresslevel) as csv_file:
             csv_writer = writer(csv_file)
             for row in table:
                 csv_writer.writerow((f"{cell.value}" for cell in row))
 
     @staticmethod
-    def load(table: Table, filepath: str) -> None:
-        """Loads rows from a CSV file to a table."""
-        with open(filepath, "r", encoding="utf-8", newline="") as csv_file:
-            for entries in reader(csv_file):
-                table.add_row(entries)
+    @instrumented_io("csv.load")
+    def load(
+        table: Table, filepath: File, infer_dtypes: bool = False, processes: Optional[int] = 1
+    ) -> None:
+        """Loads rows from a CSV file to a table, optionally inferring column dtypes.
+
+        Large uncompressed files are parsed in up to `processes` processes, or as many as there are
+        CPUs if `None`, see `tabling.io.parallel`.
+        """
+        if processes != 1 and isinstance(filepath, (str, PathLike)) and not compression(filepath):
+            load_parallel(table, fspath(filepath), ",", processes)
+        else:
+            with open_text(filepath, "r", newline="") as csv_file:
+                for entries in reader(csv_file):
+                    table.add_row(entries)
+        if infer_dtypes:
+            table.infer_dtypes()
@@ -1,17 +1,22 @@
 """Defines the html class."""
 
 import re
-from typing import Dict, Iterator, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from .css import css
+from ..profiling import instrumented_io
 from ..table import Table
+from .stream import File, open_text
 
 
 class html:  # pylint: disable=invalid-name, too-few-public-methods
     """Represents html file io."""
 
     @staticmethod
-    def dump(table: Table, filepath: str) -> None:  # pylint: disable=too-many-statements
-        """Dumps a table into an html file."""
+    @instrumented_io("html.dump")
+    def dump(  # pylint: disable=too-many-statements
+        table: Table, filepath: File, compresslevel: Optional[int] = None
+    ) -> None:
+        """Dumps a table into an html file, compressed if named `*.gz`, `*.bz2` or `*.xz`."""
         page = (
             "<!DOCTYPE html>\n"
             + "<html>\n"
@@ -38,19 +43,20 @@ class html:  # pylint: disable=invalid-name, too-few-public-methods
         page += "<body>\n"
         page += "</html>\n"
 
-        with open(filepath, "w", encoding="utf-8") as html_file:
+        with open_text(filepath, "w", compresslevel=compresslevel) as html_file:
             html_file.write(page)
 
     @staticmethod
-    def load(table: Table, filepath: str, index: int = 0) -> None:
+    @instrumented_io("html.load")
+    def load(table: Table, filepath: File, index: int = 0) -> None:
         """Loads rows from HTML file to table."""
         if tables := tuple(html.loadall(filepath)):
             table += tables[min(len(tables) - 1, index)]
 
     @staticmethod
-    def loadall(filepath: str) -> Iterator[Table]:  # pylint: disable=too-many-locals
+    def loadall(filepath: File) -> Iterator[Table]:  # pylint: disable=too-many-locals
         """Loads all tables in an HTML file."""
-        with open(filepath, "r", encoding="utf-8") as html_file:
+        with open_text(filepath, "r") as html_file:
             page = html_file.read()
 
         def findall(tag: str, scope: str) -> List[Tuple[str, str]]:
@@ -2,26 +2,30 @@
 
 from json import dump, load
 from typing import Any, Dict, List, Optional, Union
+from ..profiling import instrumented_io
 from ..table import Table
+from .stream import File, open_text
 
 
 class json:  # pylint: disable=invalid-name
     """Represents JSON io operations."""
 
     @staticmethod
-    def dump(table: Table, filepath: str) -> None:
-        """Dumps a table into a JSON file."""
+    @instrumented_io("json.dump")
+    def dump(table: Table, filepath: File, compresslevel: Optional[int] = None) -> None:
+        """Dumps a table into a JSON file, compressed if named `*.gz`, `*.bz2` or `*.xz`."""
         root: List[Dict] = []
         if table:
             header = table[0]
             for row in table[1:]:
                 root.append({header[i].value: row[i].value for i in range(len(header))})
-        with open(filepath, "w", encoding="utf-8") as json_file:
+        with open_text(filepath, "w", compresslevel=compresslevel) as json_file:
             dump(root, json_file, indent=2)
 
     @staticmethod
+    @instrumented_io("json.load")
     def load(
-        table: Table, filepath: str, addr: Optional[str] = None
+        table: Table, filepath: File, addr: Optional[str] = None
     ):  # pylint: disable=too-many-branches
         """Loads rows from JSON file to table."""
 
@@ -62,6 +66,6 @@ class json:  # pylint: disable=invalid-name
             else:
                 raise ValueError(f"Invalid JSON in {filepath}. Root must be an array or an object.")
 
-        with open(filepath, "r", encoding="utf-8") as json_file:
+        with open_text(filepath, "r") as json_file:
             root = load(json_file)
         load_root(root)
@@ -1,18 +1,24 @@
 """Defines the `md` class."""
 
 from re import findall
-from typing import Iterator, List
+from typing import Iterator, List, Optional
 from ..cell import Cell
+from ..profiling import instrumented_io
 from ..row import Row
 from ..table import Table
+from ..width import ljust
+from .stream import File, open_text
 
 
 class md:  # pylint: disable=invalid-name, too-few-public-methods
     """Represents markdown io operations."""
 
     @staticmethod
-    def dump(table: Table, filepath: str, has_header: bool) -> None:
-        """Dumps table rows to markdown file."""
+    @instrumented_io("md.dump")
+    def dump(
+        table: Table, filepath: File, has_header: bool, compresslevel: Optional[int] = None
+    ) -> None:
+        """Dumps table rows to markdown file, compressed if named `*.gz`, `*.bz2` or `*.xz`."""
 
         if not table:
             return None
@@ -26,7 +32,7 @@ class md:  # pylint: disable=invalid-name, too-few-public-methods
         def row_to_md(row: Row, widths: List[int], fillchar: str = " ") -> str:
             md_row = "|"
             for index, cell in enumerate(row):
-                md_row += f"{cell.value}".ljust(widths[index], fillchar) + "|"
+                md_row += ljust(f"{cell.value}", widths[index], fillchar) + "|"
             return md_row + "\n"
 
         number_of_columns = len(table[0])
@@ -42,19 +48,20 @@ class md:  # pylint: disable=invalid-name, too-few-public-methods
         markdown += row_to_md(make_row("-", number_of_columns), column_widths, "-")
         for row in table[int(has_header) :]:
             markdown += row_to_md(row, column_widths)
-        with open(filepath, "w", encoding="utf-8") as md_file:
+        with open_text(filepath, "w", compresslevel=compresslevel) as md_file:
             md_file.write(markdown)
 
     @staticmethod
-    def load(table: Table, filepath: str, index: int = 0) -> None:
+    @instrumented_io("md.load")
+    def load(table: Table, filepath: File, index: int = 0) -> None:
         """Loads rows from MD file to table."""
         if tables := tuple(md.loadall(filepath)):
             table += tables[min(len(tables) - 1, index)]
 
     @staticmethod
-    def loadall(filepath: str) -> Iterator[Table]:
+    def loadall(filepath: File) -> Iterator[Table]:
         """Gets all tables in an MD file."""
-        with open(filepath, "r", encoding="utf-8") as md_file:
+        with open_text(filepath, "r") as md_file:
             markdown = md_file.read()
         row_re = r"\s*\|(.*\|\s*)+" + "\n"
         table_re = f"({row_re}{row_re}(?:{row_re})*)"
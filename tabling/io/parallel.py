@@ -0,0 +1,90 @@
+"""Defines the parallel loading of delimited text files: `load()`.
+
+A file is split into byte ranges that end after a newline outside quoted fields, i.e. after an even
+number of quotes, as in RFC 4180. Ranges are parsed by a strict `csv.reader` in a process pool and
+added to the table in file order, so the table gets the same rows as when the file is read serially.
+A quote inside an unquoted field, which `csv.reader` reads as text, can end a range inside a quoted
+field instead. The strict reader then fails at the end of the range, and the file is read serially.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from csv import Error, reader
+from io import StringIO
+from itertools import chain
+from mmap import ACCESS_READ, mmap
+from typing import List, Optional
+from ..table import Table
+
+MIN_RANGE = 1 << 20
+"""Smallest number of bytes worth parsing in a process of its own."""
+
+BLOCK = 1 << 24
+"""Number of bytes copied at a time from the file while counting quotes."""
+
+
+def load(table: Table, filepath: str, delimiter: str, processes: Optional[int]) -> None:
+    """Loads rows from a delimited file to a table, parsing ranges of it in parallel.
+
+    Up to `processes` processes are used, or as many as there are CPUs if `None`, each parsing at
+    least `MIN_RANGE` bytes.
+    """
+    with open(filepath, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        bounds = [0, size]
+        if (parts := min(processes or os.cpu_count() or 1, size // MIN_RANGE + 1)) > 1:
+            with mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+                bounds = boundaries(data, parts)
+    if (count := len(bounds) - 1) == 1:
+        table.add_rows(parse(filepath, 0, size, delimiter))
+        return
+    try:
+        with ProcessPoolExecutor(count) as executor:
+            strict = partial(parse, filepath, delimiter=delimiter, strict=True)
+            chunks = list(executor.map(strict, bounds[:-1], bounds[1:]))
+    except Error:  # a range didn't end between records
+        chunks = [parse(filepath, 0, size, delimiter)]
+    table.add_rows(chain.from_iterable(chunks))
+
+
+def boundaries(data: mmap, parts: int) -> List[int]:
+    """Gets the offsets splitting a file into about `parts` ranges of whole records."""
+    size = len(data)
+    bounds, position, quotes = [0], 0, 0
+    for part in range(1, parts):
+        if (target := size * part // parts) <= position:
+            continue
+        quotes += _count_quotes(data, position, target)
+        position = target
+        while (newline := data.find(b"\n", position)) != -1:
+            quotes += _count_quotes(data, position, newline)
+            position = newline + 1
+            if quotes % 2 == 0:
+                break
+        else:
+            break
+        if position < size:
+            bounds.append(position)
+    bounds.append(size)
+    return bounds
+
+
+def parse(
+    filepath: str, start: int, end: int, delimiter: str, strict: bool = False
+) -> List[List[str]]:
+    """Parses the records in a byte range of a delimited file.
+
+    If `strict`, `csv.Error` is raised when the range ends inside a quoted field or has malformed
+    quoted fields, which are otherwise read leniently.
+    """
+    with open(filepath, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+    return list(reader(StringIO(text, newline=""), delimiter=delimiter, strict=strict))
+
+
+def _count_quotes(data: mmap, start: int, end: int) -> int:
+    return sum(
+        data[block : min(block + BLOCK, end)].count(b'"') for block in range(start, end, BLOCK)
+    )
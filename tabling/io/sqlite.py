@@ -2,6 +2,7 @@
 
 from sqlite3 import connect
 from typing import Self
+from ..profiling import instrumented_io
 from ..row import Row
 from ..table import Table
 
@@ -10,6 +11,7 @@ class sqlite:
     """Represents sqlite io operations."""
 
     @staticmethod
+    @instrumented_io("sqlite.dump")
     def dump(table: Table, filepath: str, title: str) -> None:
         """Dumps a table to sql file."""
         con = connect(filepath)
@@ -26,6 +28,7 @@ class sqlite:
         con.close()
 
     @staticmethod
+    @instrumented_io("sqlite.load")
     def load(table: Table, filepath: str, title: str) -> None:
         """Loads a table from sql file."""
         con = connect(filepath)
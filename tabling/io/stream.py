@@ -0,0 +1,80 @@
+"""Defines the opening of text files, compressed or not: `open_text()`, `compression()`.
+
+Files are paths or open file objects. gzip, bz2 and xz compression is detected from the first bytes
+of files being read, and from the name of files being written, e.g. `table.csv.gz`.
+"""
+
+import os
+from contextlib import contextmanager
+from importlib import import_module
+from io import TextIOBase, TextIOWrapper
+from typing import IO, Any, Dict, Iterator, Optional, TextIO, Tuple, TypeAlias, Union
+
+File: TypeAlias = Union[str, os.PathLike, IO[Any]]
+
+COMPRESSIONS: Dict[str, Tuple[bytes, Tuple[str, ...], str]] = {
+    "gzip": (b"\x1f\x8b", (".gz", ".gzip"), "compresslevel"),
+    "bz2": (b"BZh", (".bz2",), "compresslevel"),
+    "lzma": (b"\xfd7zXZ\x00", (".xz", ".lzma"), "preset"),
+}
+"""Magic bytes, file extensions and compression level argument of each compression module."""
+
+ENCODING = "utf-8"
+"""Encoding of every text file."""
+
+
+@contextmanager
+def open_text(
+    file: File, mode: str, newline: Optional[str] = None, compresslevel: Optional[int] = None
+) -> Iterator[TextIO]:
+    """Opens a file for reading (`r`) or writing (`w`) text, decompressing or compressing it.
+
+    File objects opened by the caller are left open.
+    """
+    options: Dict[str, Any] = {"encoding": ENCODING, "newline": newline}
+    if isinstance(file, TextIOBase):
+        yield file  # type: ignore
+    elif (name := compression(file, mode)) is not None:
+        if compresslevel is not None and mode == "w":
+            options[COMPRESSIONS[name][2]] = compresslevel
+        with import_module(name).open(file, f"{mode}t", **options) as text:
+            yield text
+    elif isinstance(file, (str, os.PathLike)):
+        with open(file, mode, **options) as text:
+            yield text  # type: ignore
+    else:
+        wrapper = TextIOWrapper(file, **options)
+        try:
+            yield wrapper
+        finally:
+            wrapper.flush()
+            wrapper.detach()
+
+
+def compression(file: File, mode: str = "r") -> Optional[str]:
+    """Gets the name of the module compressing a file, or `None` if it isn't compressed."""
+    if isinstance(file, TextIOBase):
+        return None
+    if mode == "w":
+        path = (
+            os.fspath(file) if isinstance(file, (str, os.PathLike)) else getattr(file, "name", "")
+        )
+        for name, (_, extensions, _) in COMPRESSIONS.items():
+            if isinstance(path, str) and path.lower().endswith(extensions):
+                return name
+        return None
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as binary:
+            start = binary.read(6)
+    elif hasattr(file, "peek"):
+        start = file.peek(6)[:6]
+    elif file.seekable():
+        position = file.tell()
+        start = file.read(6)
+        file.seek(position)
+    else:
+        return None
+    for name, (magic, _, _) in COMPRESSIONS.items():
+        if start.startswith(magic):
+            return name
+    return None
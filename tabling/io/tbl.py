@@ -0,0 +1,313 @@
+"""Defines the `tbl` class."""
+
+import sys
+from array import array
+from collections import Counter
+from datetime import date, datetime
+from json import dumps, loads
+from mmap import ACCESS_READ, mmap
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeAlias
+from ..cell import Cell
+from ..dtype import Category
+from ..element import Element
+from ..profiling import instrumented_io
+from ..table import Table
+
+MAGIC = b"TABLING1"
+"""Bytes starting every snapshot file, followed by the length of its JSON header."""
+
+ALIGNMENT = 8
+"""Byte boundary of every binary section, so that value columns can be mapped as arrays."""
+
+TYPECODES = {"i": "q", "f": "d", "s": "q", "c": "I"}
+"""Array type codes of the value columns of each kind: ints, floats, text offsets and categories."""
+
+STYLES_TYPECODE = "I"
+"""Array type code of the palette indices of the cell styles of a column."""
+
+FIELDS = (
+    "border.style",
+    "border.color",
+    "background.color",
+    "font.style",
+    "font.color",
+    "border.left",
+    "border.right",
+    "border.top",
+    "border.bottom",
+    "margin.left",
+    "margin.right",
+    "margin.top",
+    "margin.bottom",
+    "padding.left",
+    "padding.right",
+    "padding.top",
+    "padding.bottom",
+    "text.justify",
+    "text.align",
+    "text.wrap",
+    "text.visible",
+    "text.reverse",
+    "text.letter_spacing",
+    "text.word_spacing",
+    "text.format_spec",
+    "text.placeholder",
+    "width",
+    "height",
+)
+"""Attributes of the styles in a palette, cell styles having them all and other styles the first
+17: the border style and color, then an `Element.render_key()`, then a `Text.render_key()`."""
+
+Restyler: TypeAlias = Callable[[Any], None]
+
+
+class tbl:  # pylint: disable=invalid-name
+    """Represents binary table snapshot io operations.
+
+    A snapshot keeps values, styles and layout attributes. Values are stored column by column:
+    ints and floats as arrays that are memory-mapped when loading, text as one UTF-8 block and
+    categories as codes. Styles are deduplicated into a palette and referenced by index. Computed
+    values are stored as plain values, and other values than text, numbers, booleans, dates and
+    `None` as text.
+    """
+
+    @staticmethod
+    @instrumented_io("tbl.dump")
+    def dump(table: Table, filepath: str) -> None:
+        """Dumps a table, styles included, to a snapshot file."""
+        sections: List[bytes] = []
+        size = 0
+
+        def add_section(data: bytes) -> List[int]:
+            nonlocal size
+            sections.append(data + bytes(-len(data) % ALIGNMENT))
+            size += len(sections[-1])
+            return [size - len(sections[-1]), len(data)]
+
+        palette: Dict[Tuple, int] = {_cell_style(Cell("")): 0, _style(Element()): 1}
+
+        def index(style: Tuple) -> int:
+            return palette.setdefault(style, len(palette))
+
+        columns = []
+        for column in table._columns:  # pylint: disable=protected-access
+            spec = _dump_values(column, add_section)
+            styles = array(STYLES_TYPECODE, (index(_cell_style(cell)) for cell in column))
+            spec["styles"] = add_section(styles.tobytes()) if any(styles) else None
+            spec.update(
+                style=index(_style(column)),
+                cellspacing=column.cellspacing,
+                dtype=column.dtype,
+                format_spec=column.format_spec,
+            )
+            columns.append(spec)
+        header = {
+            "byteorder": sys.byteorder,
+            "table": {
+                "style": index(_style(table)),
+                "colspacing": table.colspacing,
+                "rowspacing": table.rowspacing,
+                "has_header": table.has_header,
+                "border_collapse": table.border_collapse,
+            },
+            "rows": [[index(_style(row)), row.cellspacing] for row in table],
+            "columns": columns,
+            "palette": list(palette),
+        }
+        encoded = dumps(header, default=_encode).encode()
+        with open(filepath, "wb") as file:
+            file.write(MAGIC + len(encoded).to_bytes(8, "little") + encoded)
+            file.write(bytes(-(len(MAGIC) + 8 + len(encoded)) % ALIGNMENT))
+            file.writelines(sections)
+
+    @staticmethod
+    @instrumented_io("tbl.load")
+    def load(table: Table, filepath: str) -> None:  # pylint: disable=too-many-locals
+        """Loads rows from a snapshot file to a table, restoring their styles and the table's."""
+        with open(filepath, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+            if data[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"Invalid snapshot file {filepath!r}.")
+            length = int.from_bytes(data[len(MAGIC) : len(MAGIC) + 8], "little")
+            header = loads(data[len(MAGIC) + 8 : len(MAGIC) + 8 + length], object_hook=_decode)
+            start = len(MAGIC) + 8 + length
+            start += -start % ALIGNMENT
+            swap = header["byteorder"] != sys.byteorder
+
+            def read(section: List[int], typecode: str) -> List[Any]:
+                return _read(data, start + section[0], section[1], typecode, swap)
+
+            specs = header["columns"]
+            values = [_load_values(spec, data, start, read) for spec in specs]
+            styles = [
+                read(spec["styles"], STYLES_TYPECODE) if spec["styles"] else () for spec in specs
+            ]
+        table.add_rows(zip(*values))
+        cell_default, element_default = header["palette"][:2]
+        restylers = [
+            _restyler(style, cell_default if len(style) == len(FIELDS) else element_default)
+            for style in header["palette"]
+        ]
+        attributes = header["table"]
+        restylers[attributes.pop("style")](table)
+        for name, value in attributes.items():
+            setattr(table, name, value)
+        # loaded rows are the last ones, unless the oldest were evicted from a ring-buffer table
+        rows, columns = table._rows, table._columns  # pylint: disable=protected-access
+        for row, (style, cellspacing) in zip(reversed(rows), reversed(header["rows"])):
+            row.cellspacing = cellspacing
+            restylers[style](row)
+        for column, spec, indices in zip(columns, specs, styles):
+            column.cellspacing, column.dtype = spec["cellspacing"], spec["dtype"]
+            if column.dtype == "category":
+                texts = (cell.text.text for cell in column)
+                categories = {id(text): text for text in texts if isinstance(text, Category)}
+                column.categories = list(categories.values())
+            column.format_spec = spec["format_spec"]
+            restylers[spec["style"]](column)
+            for cell, style in zip(reversed(column[:]), reversed(indices)):
+                if style:
+                    restylers[style](cell)
+
+
+def _dump_values(column: Any, add_section: Callable[[bytes], List[int]]) -> Dict[str, Any]:
+    """Stores the values of a column as an array of their most common kind, plus exceptions."""
+    values: List[Any] = [
+        cell.text.text if isinstance(cell.text.text, Category) else cell.value for cell in column
+    ]
+    kinds = [_kind(value) for value in values]
+    kind = next((kind for kind, _ in Counter(filter(None, kinds)).most_common(1)), "o")
+    if kind == "o":
+        return {"kind": kind, "exceptions": [], "values": values}
+    exceptions = [[index, value] for index, value in enumerate(values) if kinds[index] != kind]
+    spec: Dict[str, Any] = {"kind": kind, "exceptions": exceptions}
+    for index, _ in exceptions:
+        values[index] = "" if kind == "s" else 0
+    if kind == "s":
+        ends = array("q")
+        end = 0
+        for value in values:
+            end += len(value)
+            ends.append(end)
+        spec["data"] = add_section(ends.tobytes())
+        spec["text"] = add_section("".join(values).encode())
+    elif kind == "c":
+        categories: Dict[int, int] = {}
+        codes = array("I")
+        for value in values:
+            if isinstance(value, Category):
+                codes.append(categories.setdefault(id(value), len(categories)))
+            else:
+                codes.append(0)
+        unique = {id(value): value for value in values if isinstance(value, Category)}
+        spec["categories"] = [unique[key].value for key in categories]
+        spec["data"] = add_section(codes.tobytes())
+    else:
+        spec["data"] = add_section(array(TYPECODES[kind], values).tobytes())
+    return spec
+
+
+def _load_values(
+    spec: Dict[str, Any], data: mmap, start: int, read: Callable[[List[int], str], List[Any]]
+) -> List[Any]:
+    kind = spec["kind"]
+    typecode = TYPECODES.get(kind, "")
+    if kind == "o":
+        values = spec["values"]
+    elif kind == "s":
+        offset, length = spec["text"]
+        text = data[start + offset : start + offset + length].decode()
+        ends = read(spec["data"], typecode)
+        values = [text[begin:end] for begin, end in zip([0, *ends], ends)]
+    elif kind == "c":
+        categories = [Category(value) for value in spec["categories"]]
+        values = [categories[code] for code in read(spec["data"], typecode)]
+    else:
+        values = read(spec["data"], typecode)
+    for index, value in spec["exceptions"]:
+        values[index] = value
+    return values
+
+
+def _read(data: mmap, offset: int, length: int, typecode: str, swap: bool) -> List[Any]:
+    """Reads an array from a memory-mapped file, without copying it unless bytes are swapped."""
+    if swap:
+        values = array(typecode, data[offset : offset + length])
+        values.byteswap()
+        return values.tolist()
+    with memoryview(data) as view, view[offset : offset + length] as part:
+        with part.cast(typecode) as cast:  # type: ignore
+            return cast.tolist()
+
+
+def _kind(value: Any) -> Optional[str]:
+    if type(value) is int:  # pylint: disable=unidiomatic-typecheck  # bools are not ints here
+        return "i" if -(2**63) <= value < 2**63 else None
+    if type(value) is float:  # pylint: disable=unidiomatic-typecheck
+        return "f"
+    if isinstance(value, str):
+        return "s"
+    if isinstance(value, Category):
+        return "c"
+    return None
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Category):
+        return value.value
+    return f"{value}"
+
+
+def _decode(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and "$datetime" in obj:
+        return datetime.fromisoformat(obj["$datetime"])
+    if len(obj) == 1 and "$date" in obj:
+        return date.fromisoformat(obj["$date"])
+    return obj
+
+
+def _style(element: Element) -> Tuple:
+    return (element.border.style, element.border.color, *Element.render_key(element))
+
+
+def _cell_style(cell: Cell) -> Tuple:
+    return (
+        *_style(cell),
+        *cell.text.render_key(),
+        cell._width,  # pylint: disable=protected-access
+        cell._height,  # pylint: disable=protected-access
+    )
+
+
+def _restyler(style: Sequence[Any], default: Sequence[Any]) -> Restyler:
+    """Makes a function setting the attributes of a style that differ from the default style."""
+    changes = [
+        (_setter(field), value)
+        for field, value, default_value in zip(FIELDS, style, default)
+        if value != default_value
+    ]
+
+    def restyle(element: Any) -> None:
+        for setter, value in changes:
+            setter(element, value)
+
+    return restyle
+
+
+def _setter(field: str) -> Callable[[Any, Any], None]:
+    owner, _, name = field.rpartition(".")
+    if owner == "border" and name in ("left", "right", "top", "bottom"):
+
+        def set_side(element: Any, value: Any) -> None:
+            side = getattr(element.border, name)
+            side.style, side.color, side.char = value
+
+        return set_side
+
+    def set_attribute(element: Any, value: Any) -> None:
+        setattr(getattr(element, owner) if owner else element, name, value)
+
+    return set_attribute
@@ -1,23 +1,41 @@
 """Defines the `tsv` class."""
 
 from csv import reader, writer
+from os import PathLike, fspath
+from typing import Optional
+from ..profiling import instrumented_io
 from ..table import Table
+from .parallel import load as load_parallel
+from .stream import File, compression, open_text
 
 
 class tsv:  # pylint: disable=invalid-name
     """Represents TSV io operations."""
 
     @staticmethod
-    def dump(table: Table, filepath: str) -> None:
-        """Dumps a table to a TSV file."""
-        with open(filepath, "w", encoding="utf-8", newline="") as tsv_file:
+    @instrumented_io("tsv.dump")
+    def dump(table: Table, filepath: File, compresslevel: Optional[int] = None) -> None:
+        """Dumps a table to a TSV file, compressed if named `*.gz`, `*.bz2` or `*.xz`."""
+        with open_text(filepath, "w", newline="", compresslevel=compresslevel) as tsv_file:
             tsv_writer = writer(tsv_file, delimiter="\t")
             for row in table:
                 tsv_writer.writerow((f"{cell.value}" for cell in row))
 
     @staticmethod
-    def load(table: Table, filepath: str) -> None:
-        """Loads rows from a TSV file to a table."""
-        with open(filepath, "r", encoding="utf-8", newline="") as tsv_file:
-            for entries in reader(tsv_file, delimiter="\t"):
-                table.add_row(entries)
+    @instrumented_io("tsv.load")
+    def load(
+        table: Table, filepath: File, infer_dtypes: bool = False, processes: Optional[int] = 1
+    ) -> None:
+        """Loads rows from a TSV file to a table, optionally inferring column dtypes.
+
+        Large uncompressed files are parsed in up to `processes` processes, or as many as there are
+        CPUs if `None`, see `tabling.io.parallel`.
+        """
+        if processes != 1 and isinstance(filepath, (str, PathLike)) and not compression(filepath):
+            load_parallel(table, fspath(filepath), "\t", processes)
+        else:
+            with open_text(filepath, "r", newline="") as tsv_file:
+                for entries in reader(tsv_file, delimiter="\t"):
+                    table.add_row(entries)
+        if infer_dtypes:
+            table.infer_dtypes()
@@ -1,17 +1,21 @@
 """Defines the `txt` class."""
 
+from typing import Optional
 from printly import unstyle
+from ..profiling import instrumented_io
 from ..table import Table
+from .stream import File, open_text
 
 
 class txt:  # pylint: disable=invalid-name, too-few-public-methods
     """Represents TXT io operations."""
 
     @staticmethod
-    def dump(table: Table, filepath: str) -> None:
-        """Dumps table rows to TXT file."""
+    @instrumented_io("txt.dump")
+    def dump(table: Table, filepath: File, compresslevel: Optional[int] = None) -> None:
+        """Dumps table rows to TXT file, compressed if named `*.gz`, `*.bz2` or `*.xz`."""
         preserve = table.preserve
         table.preserve = True
-        with open(filepath, "w", encoding="utf-8") as txt_file:
+        with open_text(filepath, "w", compresslevel=compresslevel) as txt_file:
             txt_file.write(unstyle(str(table)))
         table.preserve = preserve
@@ -3,6 +3,7 @@
 from typing import Optional
 from printly.style import get_rgb_values
 from printly.types import Color
+from ..profiling import instrumented_io
 from ..table import Table
 
 
@@ -10,6 +11,7 @@ class xlsx:  # pylint: disable=invalid-name
     """Represents XLSX io operations."""
 
     @staticmethod
+    @instrumented_io("xlsx.load")
     def load(table: Table, filepath: str) -> None:  # pylint: disable=too-many-locals
         """Imports table rows from excel file."""
         from openpyxl import load_workbook  # type: ignore  # pylint: disable=import-outside-toplevel
@@ -90,6 +92,7 @@ class xlsx:  # pylint: disable=invalid-name
                 table[-1][index].text = cell["text"]
 
     @staticmethod
+    @instrumented_io("xlsx.dump")
     def dump(table: Table, filepath: str) -> None:  # pylint: disable=too-many-locals
         """Exports a table to excel file."""
         from openpyxl import Workbook  # type: ignore  # pylint: disable=import-outside-toplevel
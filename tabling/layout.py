@@ -0,0 +1,69 @@
+"""Defines the layout solver: `Widths`, `fit()`."""
+
+from typing import List, Literal, NamedTuple, Sequence, TypeAlias, Union, get_args
+
+Policy: TypeAlias = Union[str, Literal["min-ragged", "proportional"]]
+Overflow: TypeAlias = Union[str, Literal["wrap", "ellipsis"]]
+
+ELLIPSIS = "…"
+"""Placeholder ending the text of cells cut short by the `ellipsis` overflow."""
+
+
+class Widths(NamedTuple):
+    """Represents the distribution of the widths of a column, measured in one pass over its cells.
+
+    `natural` is the width of the widest text, `total` adds up the widths of the `cells` texts
+    and `chrome` is the width of the margins, paddings and borders around them.
+    """
+
+    natural: int
+    total: int
+    cells: int
+    chrome: int
+
+
+def fit(columns: Sequence[Widths], space: int, policy: Policy = "min-ragged") -> List[int]:
+    """Allocates text widths to columns so that they add up to no more than `space`.
+
+    Columns keep their natural widths if they fit. Otherwise, `min-ragged` shrinks the widest
+    columns to a common width and leaves the others as they are, so that as few columns as possible
+    wrap, while `proportional` shrinks every column in proportion to its average text width. Shrunk
+    columns are at least 1 wide, so the result may exceed a space too small for every column.
+    """
+    if policy not in (policies := get_args(get_args(Policy)[1])):
+        raise ValueError(f"Invalid layout policy {policy!r}. Expected one of {policies}")
+    if sum(column.natural for column in columns) <= space:
+        return [column.natural for column in columns]
+    naturals = [max(column.natural, 1) for column in columns]
+    if policy == "min-ragged":
+        weights = [1.0] * len(columns)
+    else:
+        weights = [
+            max(column.total / column.cells, 1.0) if column.cells else 1.0 for column in columns
+        ]
+    # columns whose share would exceed their natural width keep it; visiting them in order of
+    # natural width per weight settles each one in a single pass after sorting
+    order = sorted(range(len(columns)), key=lambda index: naturals[index] / weights[index])
+    widths = [0] * len(columns)
+    remaining, weight = space, sum(weights)
+    for position, index in enumerate(order):
+        if naturals[index] * weight > remaining * weights[index]:
+            _share(widths, order[position:], weights, remaining, weight)
+            break
+        widths[index] = naturals[index]
+        remaining -= naturals[index]
+        weight -= weights[index]
+    return widths
+
+
+def _share(
+    widths: List[int], indices: List[int], weights: List[float], space: int, weight: float
+) -> None:
+    """Shares space between columns by weight, rounding the largest fractional shares up."""
+    shares = [space * weights[index] / weight for index in indices]
+    for index, share in zip(indices, shares):
+        widths[index] = max(int(share), 1)
+    leftover = space - sum(widths[index] for index in indices)
+    by_remainder = sorted(zip(shares, indices), key=lambda pair: pair[0] % 1, reverse=True)
+    for _, index in by_remainder[: max(leftover, 0)]:
+        widths[index] += 1
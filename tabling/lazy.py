@@ -0,0 +1,173 @@
+"""Defines the `LazyTable` class."""
+
+import os
+import re
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from csv import Error, reader
+from io import StringIO
+from mmap import ACCESS_READ, mmap
+from typing import Any, Iterable, Iterator, List, Optional, Self, Tuple, Union
+from .table import Table
+
+BLOCK = 1 << 24
+"""Number of bytes scanned at a time while indexing records."""
+
+RECORD = re.compile(rb'["\n]')
+"""Pattern of the bytes that start or end quoted fields and records."""
+
+LINE = re.compile(rb"[^\r\n]*(?:\r\n?|\n)|[^\r\n]+")
+"""Pattern of a line, as split by `csv.reader` reading a file opened with `newline=""`."""
+
+
+class LazyTable:  # pylint: disable=too-many-instance-attributes
+    """Represents a read-only table over a memory-mapped CSV file, parsed as rows are accessed.
+
+    Opening the file indexes the offsets of its records in one scan, treating newlines in quoted
+    fields as part of them. Records with quotes are then checked with a strict `csv.reader`, and if
+    one isn't a single record, e.g. after a quote inside an unquoted field, the file is indexed
+    again by `csv.reader`. A row is parsed when it is accessed, and the last `cache_rows` parsed
+    rows are kept. Render pages of rows with `view()`, and search the file with `find()`.
+    """
+
+    def __init__(
+        self: Self,
+        filepath: str,
+        delimiter: str = ",",
+        has_header: bool = True,
+        cache_rows: int = 1024,
+    ) -> None:
+        if cache_rows < 1:
+            raise ValueError(f"Invalid number of cached rows {cache_rows}. Must be >= 1.")
+        self.filepath: str = filepath
+        self.delimiter: str = delimiter
+        self.has_header: bool = has_header
+        self.cache_rows: int = cache_rows
+        self._file = open(filepath, "rb")  # pylint: disable=consider-using-with
+        self._data: Union[mmap, bytes] = b""  # empty files can't be mapped
+        if os.fstat(self._file.fileno()).st_size:
+            self._data = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        self._offsets, quoted = self._index()
+        if not all(self._is_record(index) for index in quoted):
+            self._offsets = self._reindex()
+        self._rows: OrderedDict[int, List[str]] = OrderedDict()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *_: Any) -> None:
+        self.close()
+
+    def __len__(self: Self) -> int:
+        return len(self._offsets) - 1
+
+    def __bool__(self: Self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self: Self) -> Iterator[List[str]]:
+        return (self[index] for index in range(len(self)))
+
+    def __getitem__(self: Self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Row index {index} is out of range.")
+        index %= len(self)
+        if (row := self._rows.get(index)) is not None:
+            self._rows.move_to_end(index)
+            return row
+        row = self._parse(index)
+        self._rows[index] = row
+        if len(self._rows) > self.cache_rows:
+            self._rows.popitem(last=False)
+        return row
+
+    def close(self: Self) -> None:
+        """Closes the file."""
+        if isinstance(self._data, mmap):
+            self._data.close()
+        self._file.close()
+        self._rows.clear()
+
+    def view(self: Self, start: int = 0, stop: Optional[int] = None) -> Table:
+        """Gets a table of the rows from `start` to `stop`, after the header row if `has_header`.
+
+        Positions count the rows after the header row if `has_header`, e.g. `view(0, 50)` is the
+        first page of 50 rows.
+        """
+        first = int(self.has_header)
+        body = range(len(self) - first)[start:stop]
+        return self._table(range(body.start + first, body.stop + first, body.step))
+
+    def find(self: Self, value: Any, limit: int = 100) -> None:
+        """Displays a table of the first `limit` rows containing a value, highlighting matches.
+
+        The file is searched without parsing rows, for `value` as a case-insensitive regular
+        expression, and only matching rows are parsed.
+        """
+        pattern = re.compile(f"{value}".encode(), re.IGNORECASE)
+        indices: List[int] = []
+        start = self._offsets[min(int(self.has_header), len(self))]
+        for match in pattern.finditer(self._data, start):
+            index = bisect_right(self._offsets, match.start()) - 1
+            if not indices or indices[-1] != index:
+                if len(indices) == limit:
+                    break
+                indices.append(index)
+        self._table(indices).find(value)
+
+    def _table(self: Self, indices: Iterable[int]) -> Table:
+        table = Table(has_header=self.has_header)
+        header = [self[0]] if self.has_header and len(self) else []
+        table.add_rows(header + [self[index] for index in indices])
+        return table
+
+    def _index(self: Self) -> Tuple["array[int]", List[int]]:
+        """Gets the offset of each record, then the size of the file, and the quoted records."""
+        data, offsets, in_quotes = self._data, array("q", [0]), False
+        quoted: List[int] = []
+        for start in range(0, len(data), BLOCK):
+            block = data[start : start + BLOCK]
+            if not in_quotes and b'"' not in block:
+                offsets.extend(match.end() + start for match in re.finditer(b"\n", block))
+                continue
+            for match in RECORD.finditer(block):
+                if match.group() == b'"':
+                    in_quotes = not in_quotes
+                    if not quoted or quoted[-1] != len(offsets) - 1:
+                        quoted.append(len(offsets) - 1)
+                elif not in_quotes:
+                    offsets.append(match.end() + start)
+        if offsets[-1] != len(data):
+            offsets.append(len(data))
+        return offsets, quoted
+
+    def _reindex(self: Self) -> "array[int]":
+        """Gets the offset of each record, then the size of the file, as read by `csv.reader`."""
+        offsets, end = array("q", [0]), 0
+
+        def lines() -> Iterator[str]:
+            nonlocal end
+            for match in LINE.finditer(self._data):
+                end = match.end()
+                yield match.group().decode("utf-8")
+
+        for _ in reader(lines(), delimiter=self.delimiter):
+            offsets.append(end)  # the reader stops reading lines at the end of each record
+        if offsets[-1] != len(self._data):
+            offsets.append(len(self._data))
+        return offsets
+
+    def _is_record(self: Self, index: int) -> bool:
+        """Gets whether the bytes indexed as a record are read as one record by a strict reader."""
+        text = self._data[self._offsets[index] : self._offsets[index + 1]].decode("utf-8")
+        try:
+            rows = list(reader(StringIO(text, newline=""), delimiter=self.delimiter, strict=True))
+        except Error:
+            return False
+        return len(rows) == 1
+
+    def _parse(self: Self, index: int) -> List[str]:
+        text = self._data[self._offsets[index] : self._offsets[index + 1]].decode("utf-8")
+        return next(reader(StringIO(text, newline=""), delimiter=self.delimiter), [])
@@ -0,0 +1,148 @@
+"""Defines the `Stats` class, the `profile()` context manager and the instrumentation hooks."""
+
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Dict, Iterator, Optional, Self, TypeVar
+
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+_ACTIVE: ContextVar[Optional["Stats"]] = ContextVar("tabling_stats", default=None)
+
+
+class Stats:
+    """Represents the time spent and the work done while rendering, loading or dumping tables.
+
+    Times are inclusive: the time of a phase also counts towards every phase it runs within, e.g.
+    printly styling is part of both `printly` and `font`.
+    """
+
+    def __init__(self: Self) -> None:
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.rows: Dict[str, int] = defaultdict(int)
+        self.bytes: int = 0
+
+    def __str__(self: Self) -> str:
+        lines = [f"{'phase':<16}{'calls':>10}{'seconds':>12}{'rows/s':>14}"]
+        for name in sorted(self.seconds, key=self.seconds.__getitem__, reverse=True):
+            rate = f"{self.rows_per_second(name):,.0f}" if name in self.rows else ""
+            lines.append(f"{name:<16}{self.calls[name]:>10}{self.seconds[name]:>12.6f}{rate:>14}")
+        lines.append(f"{'bytes emitted':<16}{self.bytes:>22,}")
+        return "\n".join(lines)
+
+    def record(self: Self, name: str, seconds: float, rows: int = -1) -> None:
+        """Records one call of a phase."""
+        self.seconds[name] += seconds
+        self.calls[name] += 1
+        if rows != -1:
+            self.rows[name] += rows
+
+    def rows_per_second(self: Self, name: str) -> float:
+        """Gets the rate at which an io operation, e.g. `csv.load`, read or wrote rows."""
+        if not (seconds := self.seconds.get(name)):
+            return 0.0
+        return self.rows.get(name, 0) / seconds
+
+
+@contextmanager
+def profile(stats: Optional[Stats] = None) -> Iterator[Stats]:
+    """Records rendering and io statistics of the current thread or task while in the context.
+
+    >>> with profile() as stats:
+    ...     output = str(table)
+    >>> print(stats)
+    """
+    stats = Stats() if stats is None else stats
+    token = _ACTIVE.set(stats)
+    try:
+        yield stats
+    finally:
+        _ACTIVE.reset(token)
+
+
+def instrumented(name: str) -> Callable[[Function], Function]:
+    """Makes a decorator recording the time and calls of a function while profiling."""
+
+    def decorate(function: Function) -> Function:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if (stats := _ACTIVE.get()) is None:
+                return function(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stats.record(name, perf_counter() - start)
+
+        return wrapper  # type: ignore
+
+    return decorate
+
+
+def instrumented_io(name: str) -> Callable[[Function], Function]:
+    """Makes a decorator recording the time and rows of an io function taking a table first."""
+
+    def decorate(function: Function) -> Function:
+        @wraps(function)
+        def wrapper(table: Any, *args: Any, **kwargs: Any) -> Any:
+            if (stats := _ACTIVE.get()) is None:
+                return function(table, *args, **kwargs)
+            rows, start = len(table), perf_counter()
+            try:
+                return function(table, *args, **kwargs)
+            finally:
+                rows = len(table) - rows if name.endswith("load") else len(table)
+                stats.record(name, perf_counter() - start, rows)
+
+        return wrapper  # type: ignore
+
+    return decorate
+
+
+def phase(name: str) -> ContextManager:
+    """Gets a context manager recording the time spent in a block while profiling."""
+    if (stats := _ACTIVE.get()) is None:
+        return nullcontext()
+    return _Timer(stats, name)
+
+
+def emitted(text: str) -> str:
+    """Records the bytes of rendered output while profiling and returns the output."""
+    if (stats := _ACTIVE.get()) is not None:
+        stats.bytes += len(text.encode())
+    return text
+
+
+@instrumented("printly")
+def style(
+    text: str, fg: Optional[str] = None, bg: Optional[str] = None, fs: Optional[str] = None
+) -> str:
+    """Applies printly styles to text, recorded as the `printly` phase while profiling.
+
+    Unstyled text is returned as is, so printly and its color validation are only imported once
+    something is actually styled.
+    """
+    if fg or bg or fs:
+        return _printly_style()(text, fg=fg, bg=bg, fs=fs)
+    return text
+
+
+@lru_cache(maxsize=None)
+def _printly_style() -> Callable[..., str]:
+    from printly import style as printly_style  # pylint: disable=import-outside-toplevel
+
+    return printly_style
+
+
+class _Timer:  # pylint: disable=too-few-public-methods
+    def __init__(self: Self, stats: Stats, name: str) -> None:
+        self._stats, self._name, self._start = stats, name, 0.0
+
+    def __enter__(self: Self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(self: Self, *_: Any) -> None:
+        self._stats.record(self._name, perf_counter() - self._start)
@@ -1,8 +1,12 @@
 """Defines the `Background` class."""
 
-from typing import Optional, Self
-from printly import style as apply_color
-from printly.types import Color
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Self
+from ..profiling import instrumented, style as apply_color
+
+if TYPE_CHECKING:
+    from printly.types import Color
 
 
 class Background:  # pylint: disable=too-few-public-methods
@@ -11,6 +15,13 @@ class Background:  # pylint: disable=too-few-public-methods
     def __init__(self: Self, color: Optional[Color]) -> None:
         self.color: Optional[Color] = color
 
+    def copy(self: Self) -> "Background":
+        """Copies the background."""
+        background = Background.__new__(Background)
+        background.__dict__.update(self.__dict__)
+        return background
+
+    @instrumented("background")
     def apply(self: Self, text: str) -> str:
         """Applies the background to given text."""
         return apply_color(text, bg=self.color)
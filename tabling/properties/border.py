@@ -1,15 +1,43 @@
 """Defines the `Border` class."""
 
-from typing import Dict, Literal, Optional, Self, TypeAlias, Union
-from printly import style as apply_color, unstyle
-from printly.types import Color
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Literal, Optional, Self, Sequence, Tuple, TypeAlias, Union
+from ..profiling import instrumented, style as apply_color
+from ..width import display_width, ljust
+
+if TYPE_CHECKING:
+    from printly.types import Color
 
 Style: TypeAlias = Union[str, Literal["single", "double", "dashed", "dotted", "solid", "curved"]]
 Side: TypeAlias = Literal[
-    "left", "right", "top", "bottom", "top-left", "top-right", "bottom-left", "bottom-right"
+    "left",
+    "right",
+    "top",
+    "bottom",
+    "top-left",
+    "top-right",
+    "bottom-left",
+    "bottom-right",
+    "top-tee",
+    "bottom-tee",
+    "left-tee",
+    "right-tee",
+    "cross",
 ]
 
 
+@lru_cache(maxsize=1024)
+def segment(char: str, color: Optional[Color], length: int) -> str:
+    """Generates a border segment: the first character of `char` repeated and colored.
+
+    Segments repeat across cells of the same size, so they are cached process-wide and colored only
+    once. `segment.cache_info()` counts the hits and misses of the cache.
+    """
+    return apply_color(char[0:1] * length, fg=color)
+
+
 class Border:  # pylint: disable=too-many-instance-attributes
     """Represents a border."""
 
@@ -21,31 +49,54 @@ class Border:  # pylint: disable=too-many-instance-attributes
         self.style: Optional[Style] = style
         self.color: Optional[Color] = color
 
+    def copy(self: Self) -> "Border":
+        """Copies the border and its sides."""
+        border = Border.__new__(Border)
+        border.__dict__.update(self.__dict__)
+        border.left, border.right = self.left.copy(), self.right.copy()
+        border.top, border.bottom = self.top.copy(), self.bottom.copy()
+        return border
+
+    @instrumented("border")
     def apply(self: Self, text: str) -> str:
         """Applies the border to given text."""
         left, right = self.left.render(1), self.right.render(1)
-        length = max(map(len, map(unstyle, text.split("\n"))))
-        inline = "\n".join(
-            left + line.ljust(length + len(line) - len(unstyle(line))) + right
-            for line in text.split("\n")
-        )
+        lines = text.split("\n")
+        length = max(map(display_width, lines))
+        inline = "\n".join(left + ljust(line, length) + right for line in lines)
         overline = underline = ""
         if self.top.char:
-            top_left = self._Side("top-left", self.left.style, self.left.color)
-            top_right = self._Side("top-right", self.right.style, self.right.color)
-            top_left.char = top_left.char or self.left.char
-            top_right.char = top_right.char or self.right.char
-            overline = top_left.render(1) + self.top.render(length) + top_right.render(1) + "\n"
+            top_left, top_right = self._corner("top-left"), self._corner("top-right")
+            overline = top_left + self.top.render(length) + top_right + "\n"
         if self.bottom.char:
-            bottom_left = self._Side("bottom-left", self.left.style, self.left.color)
-            bottom_right = self._Side("bottom-right", self.right.style, self.right.color)
-            bottom_left.char = bottom_left.char or self.left.char
-            bottom_right.char = bottom_right.char or self.right.char
-            underline = "\n" + (
-                bottom_left.render(1) + self.bottom.render(length) + bottom_right.render(1)
-            )
+            bottom_left, bottom_right = self._corner("bottom-left"), self._corner("bottom-right")
+            underline = "\n" + bottom_left + self.bottom.render(length) + bottom_right
         return overline + inline + underline
 
+    def _corner(self: Self, corner: Side) -> str:
+        """Generates a corner in the style of its left or right side, or that side's character."""
+        side = self.left if corner.endswith("left") else self.right
+        return segment(self._Side.CHARS[side.style][corner] or side.char, side.color, 1)
+
+    def grid(self: Self, widths: Sequence[int]) -> Tuple[str, str, str, str]:
+        """Generates the rules of a grid of columns sharing borders, in the border style and color.
+
+        The rules are the top, inner and bottom horizontal rules, with junctions between the columns
+        of the given widths, and the vertical rule.
+        """
+        chars = self._Side.CHARS[self.style]
+
+        def rule(left: Side, junction: Side, right: Side) -> str:
+            line = chars[junction].join(chars["top"] * width for width in widths)
+            return apply_color(chars[left] + line + chars[right], fg=self.color)
+
+        return (
+            rule("top-left", "top-tee", "top-right"),
+            rule("left-tee", "cross", "right-tee"),
+            rule("bottom-left", "bottom-tee", "bottom-right"),
+            apply_color(chars["left"], fg=self.color),
+        )
+
     @property
     def style(self: Self) -> Optional[Style]:
         """Gets the border style."""
@@ -76,9 +127,15 @@ class Border:  # pylint: disable=too-many-instance-attributes
             self.color: Optional[Color] = color
             self.char: str
 
+        def copy(self: Self) -> "Border._Side":
+            """Copies the side."""
+            side = self.__class__.__new__(self.__class__)
+            side.__dict__.update(self.__dict__)
+            return side
+
         def render(self: Self, length: int) -> str:
             """Generates a visual representation of the side."""
-            return apply_color(self.char[0:1] * length, fg=self.color)
+            return segment(self.char, self.color, length)
 
         @property
         def style(self: Self) -> Optional[Style]:
@@ -102,6 +159,11 @@ class Border:  # pylint: disable=too-many-instance-attributes
                 "top-right": "",
                 "bottom-left": "",
                 "bottom-right": "",
+                "top-tee": "",
+                "bottom-tee": "",
+                "left-tee": "",
+                "right-tee": "",
+                "cross": "",
             },
             "single": {
                 "left": "│",
@@ -112,6 +174,11 @@ class Border:  # pylint: disable=too-many-instance-attributes
                 "top-right": "┐",
                 "bottom-left": "└",
                 "bottom-right": "┘",
+                "top-tee": "┬",
+                "bottom-tee": "┴",
+                "left-tee": "├",
+                "right-tee": "┤",
+                "cross": "┼",
             },
             "double": {
                 "left": "║",
@@ -122,6 +189,11 @@ class Border:  # pylint: disable=too-many-instance-attributes
                 "top-right": "╗",
                 "bottom-left": "╚",
                 "bottom-right": "╝",
+                "top-tee": "╦",
+                "bottom-tee": "╩",
+                "left-tee": "╠",
+                "right-tee": "╣",
+                "cross": "╬",
             },
             "dashed": {
                 "left": "┊",
@@ -132,6 +204,11 @@ class Border:  # pylint: disable=too-many-instance-attributes
                 "top-right": "┐",
                 "bottom-left": "└",
                 "bottom-right": "┘",
+                "top-tee": "┬",
+                "bottom-tee": "┴",
+                "left-tee": "├",
+                "right-tee": "┤",
+                "cross": "┼",
             },
             "dotted": {
                 "left": "⸳",
@@ -142,6 +219,11 @@ class Border:  # pylint: disable=too-many-instance-attributes
                 "top-right": "⸳",
                 "bottom-left": "⸳",
                 "bottom-right": "⸳",
+                "top-tee": "⸳",
+                "bottom-tee": "⸳",
+                "left-tee": "⸳",
+                "right-tee": "⸳",
+                "cross": "⸳",
             },
             "solid": {
                 "left": "┃",
@@ -152,6 +234,11 @@ class Border:  # pylint: disable=too-many-instance-attributes
                 "top-right": "┓",
                 "bottom-left": "┗",
                 "bottom-right": "┛",
+                "top-tee": "┳",
+                "bottom-tee": "┻",
+                "left-tee": "┣",
+                "right-tee": "┫",
+                "cross": "╋",
             },
             "curved": {
                 "left": "│",
@@ -162,6 +249,11 @@ class Border:  # pylint: disable=too-many-instance-attributes
                 "top-right": "╮",
                 "bottom-left": "╰",
                 "bottom-right": "╯",
+                "top-tee": "┬",
+                "bottom-tee": "┴",
+                "left-tee": "├",
+                "right-tee": "┤",
+                "cross": "┼",
             },
             "single-double": {
                 "left": "║",
@@ -172,5 +264,10 @@ class Border:  # pylint: disable=too-many-instance-attributes
                 "top-right": "╖",
                 "bottom-left": "╙",
                 "bottom-right": "╜",
+                "top-tee": "╥",
+                "bottom-tee": "╨",
+                "left-tee": "╟",
+                "right-tee": "╢",
+                "cross": "╫",
             },
         }
@@ -1,8 +1,12 @@
 """Defines the `Font` class."""
 
-from typing import Optional, Self
-from printly import style as apply_font
-from printly.types import Color, FontStyle as Style
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Self
+from ..profiling import instrumented, style as apply_font
+
+if TYPE_CHECKING:
+    from printly.types import Color, FontStyle as Style
 
 
 class Font:
@@ -19,6 +23,13 @@ class Font:
             style = self.style or other.style
         return Font(style, self.color or other.color)
 
+    def copy(self: Self) -> "Font":
+        """Copies the font."""
+        font = Font.__new__(Font)
+        font.__dict__.update(self.__dict__)
+        return font
+
+    @instrumented("font")
     def apply(self: Self, text: str) -> str:
         """Applies the font to given text."""
         return apply_font(text, fg=self.color, fs=self.style)
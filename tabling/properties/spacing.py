@@ -1,7 +1,8 @@
 """Defines the `Spacing` class."""
 
 from typing import Self, Tuple
-from printly import unstyle
+from ..profiling import instrumented
+from ..width import display_width
 
 
 class Spacing:  # pylint: disable=too-many-instance-attributes
@@ -13,6 +14,13 @@ class Spacing:  # pylint: disable=too-many-instance-attributes
         self.top: int = top
         self.bottom: int = bottom
 
+    def copy(self: Self) -> Self:
+        """Copies the spacing."""
+        spacing = self.__class__.__new__(self.__class__)
+        spacing.__dict__.update(self.__dict__)
+        return spacing
+
+    @instrumented("spacing")
     def apply(self: Self, text: str) -> str:
         """Applies the spacing to given text."""
         return self._apply_inline(self._apply_block(text))
@@ -22,7 +30,7 @@ class Spacing:  # pylint: disable=too-many-instance-attributes
         return "\n".join(left + line + right for line in text.split("\n"))
 
     def _apply_block(self: Self, text: str) -> str:
-        length = max(map(len, map(unstyle, text.split("\n"))))
+        length = max(map(display_width, text.split("\n")))
         top = (" " * length + "\n") * self.top
         bottom = ("\n" + " " * length) * self.bottom
         return top + text + bottom
@@ -1,14 +1,19 @@
 """Defines the `Text` class."""
 
-from textwrap import fill
-from typing import Any, Literal, Self, TypeAlias, Union, get_args
-from printly import unstyle
+from typing import Any, Literal, Self, Tuple, TypeAlias, Union, get_args
+from ..ansi import unstyle
+from ..dtype import Category
+from ..profiling import instrumented
+from ..width import center, clip, display_width, ljust, rjust, wrap as wrap_text
 
 Alignment: TypeAlias = Union[str, Literal["top", "center", "bottom"]]
 Justification: TypeAlias = Union[str, Literal["left", "center", "right"]]
 
+WRAP_LIMIT = 4096
+"""Length of text above which `textwrap` is skipped for the faster, linear `wrap()`."""
 
-class Text:  # pylint: disable=too-many-instance-attributes, too-few-public-methods
+
+class Text:  # pylint: disable=too-many-instance-attributes
     """Represents the text in a table cell."""
 
     def __init__(  # pylint: disable=too-many-arguments
@@ -21,6 +26,8 @@ class Text:  # pylint: disable=too-many-instance-attributes, too-few-public-meth
         reverse: bool = False,
         letter_spacing: int = 0,
         word_spacing: int = 1,
+        format_spec: str = "",
+        placeholder: str = "",
     ) -> None:
         self.text: Any = text
         self.justify: Justification = justify
@@ -30,31 +37,83 @@ class Text:  # pylint: disable=too-many-instance-attributes, too-few-public-meth
         self.reverse: bool = reverse
         self.letter_spacing: int = letter_spacing
         self.word_spacing: int = word_spacing
+        self.format_spec: str = format_spec
+        self.placeholder: str = placeholder
+
+    def copy(self: Self) -> "Text":
+        """Copies the text, sharing its value."""
+        text = Text.__new__(Text)
+        text.__dict__.update(self.__dict__)
+        return text
 
-    def render(self: Self, width: int, height: int) -> str:  # pylint: disable=too-many-branches
+    @instrumented("text")
+    def render(self: Self, width: int, height: int) -> str:
         """Generates a visual representation of the text."""
-        text = unstyle(self.text)
+        if not isinstance(self.text, Category):
+            return self._render(width, height)
+        key = (width, height, *self.render_key())
+        if (text := self.text.renders.get(key)) is None:
+            text = self.text.renders[key] = self._render(width, height)
+        return text
+
+    def render_key(self: Self) -> Tuple[Any, ...]:
+        """Gets a key that is equal for two texts of a value only if they render the same."""
+        return (
+            self.justify,
+            self.align,
+            self.wrap,
+            self.visible,
+            self.reverse,
+            self.letter_spacing,
+            self.word_spacing,
+            self.format_spec,
+            self.placeholder,
+        )
+
+    def _render(  # pylint: disable=too-many-branches, too-many-statements
+        self: Self, width: int, height: int
+    ) -> str:
+        value = self.text.value if isinstance(self.text, Category) else self.text
+        if self.format_spec and value is not None and value != "":
+            text = unstyle(format(value, self.format_spec))
+        else:
+            text = unstyle(f"{self.text}")
         if self.reverse:
             text = text[::-1]
-        words = ((" " * self.letter_spacing).join(words) for words in text.split())
-        text = (" " * self.word_spacing).join(words)
+        if self.letter_spacing:
+            words = ((" " * self.letter_spacing).join(word) for word in text.split())
+            text = (" " * self.word_spacing).join(words)
+        else:
+            text = (" " * self.word_spacing).join(text.split())
         if width != -1:
-            if self.wrap and width > 0:
+            if display_width(text) <= width:
+                pass  # already fits: nothing to wrap or cut
+            elif not self.wrap or width == 0:
+                if self.placeholder and (room := width - display_width(self.placeholder)) >= 0:
+                    text = clip(text, room) + self.placeholder
+                else:
+                    text = clip(text, width)
+            elif len(text) <= WRAP_LIMIT and text.isascii():
+                from textwrap import fill  # pylint: disable=import-outside-toplevel
+
                 text = fill(text, width, replace_whitespace=False)
             else:
-                text = text[:width]
+                text = "\n".join(wrap_text(text, width))
             if self.justify == "left":
-                justify = str.ljust
+                justify = ljust
             elif self.justify == "center":
-                justify = str.center
+                justify = center
             elif self.justify == "right":
-                justify = str.rjust
+                justify = rjust
             else:
                 raise ValueError(
                     f"Invalid text justification {self.justify!r}."
                     f"Expected one of {get_args(Justification)}"
                 )
-            text = "\n".join(map(lambda line: justify(line, width), text.split("\n")))
+            if "\n" in text:
+                text = "\n".join(map(lambda line: justify(line, width), text.split("\n")))
+            else:
+                text = justify(text, width)
         if height != -1:
             if height < (lines := text.count("\n") + 1):
                 text = "\n".join(text.split("\n")[:height])
@@ -72,8 +131,8 @@ class Text:  # pylint: disable=too-many-instance-attributes, too-few-public-meth
                         f"Expected one of {get_args(Alignment)}"
                     )
         if not self.visible:
-            for char in text:
-                text = text.replace(char, " ") if char != "\n" else text
-
-        max_width = max(map(len, (text_lines := text.split("\n"))))
-        return "\n".join((line.ljust(max_width) for line in text_lines))
+            text = "\n".join(" " * display_width(line) for line in text.split("\n"))
+        if "\n" not in text:
+            return text
+        max_width = max(map(display_width, (text_lines := text.split("\n"))))
+        return "\n".join((ljust(line, max_width) for line in text_lines))
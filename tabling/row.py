@@ -1,8 +1,17 @@
 """Defines the `Row` class."""
 
 from copy import deepcopy
-from typing import Self
+from typing import Any, Dict, List, Optional, Self, Tuple, TypeAlias
 from .axis import Axis
+from .cell import Cell
+from .element import Element
+from .profiling import instrumented, phase
+
+Template: TypeAlias = Tuple[str, str]
+Templates: TypeAlias = Dict[Tuple[Any, ...], Optional[Template]]
+
+SENTINEL = "\0"
+"""Character standing for the text of a cell while compiling its template."""
 
 
 class Row(Axis):
@@ -10,19 +19,70 @@ class Row(Axis):
 
     def __str__(self: Self) -> str:
         """Generates a visual representation of the row."""
+        return self.render()
+
+    def render(self: Self, templates: Optional[Templates] = None) -> str:
+        """Generates a visual representation of the row, from compiled cell templates if given."""
         if self.preserve:
-            self = deepcopy(self)  # pylint: disable=self-cls-assignment
+            with phase("copy"):
+                self = deepcopy(self)  # pylint: disable=self-cls-assignment
+        return self._render(self.join(" " * self.cellspacing, templates))
+
+    def join(self: Self, separator: str, templates: Optional[Templates] = None) -> str:
+        """Normalizes the cells and joins their visual representations side by side.
+
+        Given a dict of templates, which is filled as cell styles are met, a row of single-line
+        cells is joined from the text of each cell between the prefix and suffix of its style.
+        """
+        if templates is not None and (line := self._join_compiled(separator, templates)):
+            return line
         self._normalize()
         cells_lines = tuple(s.split("\n") for s in map(str, self._cells))
-        row_lines = [""] * max(map(len, cells_lines))
-        number_of_cells = len(cells_lines)
-        for cell_index, cell_lines in enumerate(cells_lines):
-            for line_index, line in enumerate(cell_lines):
-                if cell_index < number_of_cells - 1:
-                    line += " " * self.cellspacing
-                row_lines[line_index] += line
-        return self._render("\n".join(row_lines))
+        with phase("join"):
+            row_lines = [""] * max(map(len, cells_lines))
+            number_of_cells = len(cells_lines)
+            for cell_index, cell_lines in enumerate(cells_lines):
+                for line_index, line in enumerate(cell_lines):
+                    if cell_index < number_of_cells - 1:
+                        line += separator
+                    row_lines[line_index] += line
+        return "\n".join(row_lines)
+
+    @instrumented("template")
+    def _join_compiled(self: Self, separator: str, templates: Templates) -> Optional[str]:
+        """Joins single-line cells from templates, or gets `None` if a cell can't use one."""
+        # pylint: disable=protected-access
+        font = (self.font.style, self.font.color)
+        parts: List[str] = []
+        for cell in self._cells:
+            key = (*Element.render_key(cell), *cell.text.render_key(), *font)
+            key += (cell._width, cell._height)
+            if key not in templates:
+                templates[key] = self._compile(cell)
+            if (template := templates[key]) is None:
+                return None
+            text = cell.text.render(cell._width, -1)
+            if "\n" in text:
+                return None
+            parts.append(template[0] + text + template[1])
+        return separator.join(parts) if parts else None
+
+    def _compile(self: Self, cell: Cell) -> Optional[Template]:
+        """Gets the text before and after the text of a single-line cell in its rendering."""
+        # pylint: disable=protected-access
+        margin, padding, border = cell.margin, cell.padding, cell.border
+        if cell._width < 1 or cell._height not in (-1, 1):
+            return None
+        if margin.top or margin.bottom or padding.top or padding.bottom:
+            return None
+        if border.top.style or border.top.char or border.bottom.style or border.bottom.char:
+            return None
+        font = cell.font + self.font if self.font.style or self.font.color else cell.font
+        sentinel = SENTINEL * cell._width
+        prefix, found, suffix = cell._render(font.apply(sentinel)).partition(sentinel)
+        return (prefix, suffix) if found and "\n" not in prefix + suffix else None
 
+    @instrumented("normalize")
     def _normalize(self: Self) -> None:
         max_margin_top = max_margin_bottom = max_padding_top = max_padding_bottom = max_height = 0
         any_top_border = any_bottom_border = False
@@ -34,11 +94,13 @@ class Row(Axis):
             max_height = max(max_height, cell.height)
             any_top_border = any_top_border or bool(cell.border.top.style)
             any_bottom_border = any_bottom_border or bool(cell.border.bottom.style)
+        inherit = bool(self.font.style or self.font.color)
         for cell in self._cells:
             cell.margin.block = max_margin_top, max_margin_bottom
             cell.padding.block = max_padding_top, max_padding_bottom
             cell.height = max_height
-            cell.font += self.font
+            if inherit:
+                cell.font += self.font
             if any_top_border and not cell.border.top.style:
                 cell.padding.top += 1
             if any_bottom_border and not cell.border.bottom.style:
@@ -0,0 +1,83 @@
+"""Defines the `Rule` class and the `resolve()` function."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Self, Sequence, Tuple, Union
+from .properties import Background, Font
+
+if TYPE_CHECKING:
+    from printly.types import Color, FontStyle
+
+
+class Rule:
+    """Represents a style rule: the cells it selects and the style it gives them.
+
+    Cells are selected by row positions, column positions, an `nth` row pattern `(step, offset)`
+    matching the rows at positions `offset`, `offset + step`, `offset + 2 * step`, etc., and a
+    predicate of their value. A cell is selected if it matches every selector given, so a rule
+    without selectors selects the whole table.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self: Self,
+        *,
+        rows: Union[int, Iterable[int], None] = None,
+        columns: Union[int, Iterable[int], None] = None,
+        nth: Optional[Tuple[int, int]] = None,
+        where: Optional[Callable[[Any], bool]] = None,
+        background: Optional[Color] = None,
+        font_style: Optional[FontStyle] = None,
+        font_color: Optional[Color] = None,
+    ) -> None:
+        if nth is not None and nth[0] < 1:
+            raise ValueError(f"Invalid nth step {nth[0]}. Must be >= 1.")
+        self.rows: Optional[Tuple[int, ...]] = _positions(rows)
+        self.columns: Optional[Tuple[int, ...]] = _positions(columns)
+        self.nth: Optional[Tuple[int, int]] = nth
+        self.where: Optional[Callable[[Any], bool]] = where
+        self.background: Optional[Color] = background
+        self.font_style: Optional[FontStyle] = font_style
+        self.font_color: Optional[Color] = font_color
+
+    def __repr__(self: Self) -> str:
+        selectors = ("rows", "columns", "nth", "where", "background", "font_style", "font_color")
+        arguments = (f"{name}={value!r}" for name in selectors if (value := getattr(self, name)))
+        return f"Rule({', '.join(arguments)})"
+
+    @property
+    def by_cell(self: Self) -> bool:
+        """Gets whether the rule selects cells rather than whole rows."""
+        return self.columns is not None or self.where is not None
+
+    def selects_row(self: Self, index: int, length: int) -> bool:
+        """Gets whether the rule selects cells in the row at a position of `length` rows."""
+        if self.rows is not None and index not in self.rows and index - length not in self.rows:
+            return False
+        if self.nth is not None:
+            step, offset = self.nth
+            return index >= offset and (index - offset) % step == 0
+        return True
+
+    def selects_column(self: Self, index: int, length: int) -> bool:
+        """Gets whether the rule selects cells in the column at a position of `length` columns."""
+        return self.columns is None or index in self.columns or index - length in self.columns
+
+    def selects_value(self: Self, value: Any) -> bool:
+        """Gets whether the rule selects cells with a value."""
+        return self.where is None or bool(self.where(value))
+
+
+def resolve(rules: Sequence[Rule]) -> Tuple[Font, Background]:
+    """Combines the styles of rules into a font and background, later rules overriding earlier."""
+    font, background = Font(style=None, color=None), Background(color=None)
+    for rule in rules:
+        font.style = rule.font_style or font.style
+        font.color = rule.font_color or font.color
+        background.color = rule.background or background.color
+    return font, background
+
+
+def _positions(positions: Union[int, Iterable[int], None]) -> Optional[Tuple[int, ...]]:
+    if positions is None:
+        return None
+    return (positions,) if isinstance(positions, int) else tuple(positions)
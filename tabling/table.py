@@ -1,43 +1,151 @@
 """Defines the `Table` class."""
 
 import re
-from copy import deepcopy
-from typing import Any, Iterable, Iterator, List, Self, Union
-from printly import unstyle
+from collections import deque
+from copy import copy, deepcopy
+from functools import wraps
+from itertools import chain, islice
+from threading import RLock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Self,
+    Sequence,
+    Set,
+    Tuple,
+    TypeAlias,
+    TypeVar,
+    Union,
+    get_args,
+)
+from .ansi import coalesce, unstyle
 from .cell import Cell
 from .column import Column
+from .computed import Computed
+from .dtype import Category, DType, fits, infer, parse
 from .element import Element
-from .properties import Background
-from .row import Row
+from .formatting import Format
+from .layout import ELLIPSIS, Overflow, Policy, fit
+from .profiling import emitted, phase
+from .properties import Background, Border, Font
+from .row import Row, Templates
+from .rule import Rule, resolve
 
+if TYPE_CHECKING:
+    from .groupby import Aggregate, GroupBy
 
-class Table(Element):
+Direction: TypeAlias = Union[str, Literal["vertical", "horizontal"]]
+JoinType: TypeAlias = Union[str, Literal["inner", "left", "outer"]]
+Method = TypeVar("Method", bound=Callable[..., Any])
+
+
+def synchronized(method: Method) -> Method:
+    """Makes a table method hold the table lock in concurrent mode, after adding pending rows."""
+
+    @wraps(method)
+    def wrapper(table: "Table", *args: Any, **kwargs: Any) -> Any:
+        if (lock := table._lock) is None:  # pylint: disable=protected-access
+            return method(table, *args, **kwargs)
+        with lock:
+            table._flush()  # pylint: disable=protected-access
+            return method(table, *args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+class Table(Element):  # pylint: disable=too-many-public-methods, too-many-instance-attributes
     """Represents a table."""
 
-    def __init__(self: Self, colspacing: int = 1, rowspacing: int = 0) -> None:
+    def __init__(  # pylint: disable=too-many-arguments
+        self: Self,
+        colspacing: int = 1,
+        rowspacing: int = 0,
+        concurrent: bool = False,
+        *,
+        max_rows: Optional[int] = None,
+        has_header: bool = False,
+        border_collapse: bool = False,
+    ) -> None:
         super().__init__()
-        self._rows: List[Row] = []
+        if max_rows is not None and max_rows < 1:
+            raise ValueError(f"Invalid maximum number of rows {max_rows}. Must be >= 1.")
+        self._rows: MutableSequence[Row] = [] if max_rows is None else deque()
         self._columns: List[Column] = []
+        self._lock: Optional[RLock] = RLock() if concurrent else None
+        self._pending: Deque[List[Any]] = deque()
+        self._renders: Dict[int, Tuple[Tuple, str]] = {}
         self.colspacing: int = colspacing
         self.rowspacing: int = rowspacing
+        self.max_rows: Optional[int] = max_rows
+        self.has_header: bool = has_header
+        self.border_collapse: bool = border_collapse
+        self.rules: List[Rule] = []
+        self.formats: List[Format] = []
+
+    def __copy__(self: Self) -> "Table":
+        table = self.__class__.__new__(self.__class__)
+        table.__dict__.update(self.__dict__)
+        table._lock = None
+        table._pending = deque()
+        table.rules, table.formats = self.rules.copy(), self.formats.copy()
+        table._rows = type(self._rows)(copy(row) for row in self._rows)  # type: ignore
+        table._columns = [copy(column) for column in self._columns]
+        return table
 
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> "Table":
+        table = super().__deepcopy__(memo)
+        table._lock = None if self._lock is None else RLock()
+        table._pending = deepcopy(self._pending, memo)
+        table._renders = {}
+        table.rules, table.formats = self.rules.copy(), self.formats.copy()
+        # rows copy every cell once; columns then find the copies in the memo
+        table._rows = type(self._rows)(deepcopy(row, memo) for row in self._rows)  # type: ignore
+        table._columns = [deepcopy(column, memo) for column in self._columns]
+        return table
+
+    def __getstate__(self: Self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_lock"] = self._lock is not None
+        state["_renders"] = {}
+        return state
+
+    def __setstate__(self: Self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = RLock() if state["_lock"] else None
+
+    @synchronized
     def __bool__(self: Self) -> bool:
         return bool(self._rows)
 
+    @synchronized
     def __len__(self: Self) -> int:
         return len(self._rows)
 
+    @synchronized
     def __iter__(self: Self) -> Iterator:
-        return iter(self._rows)
+        return iter(self._rows if self._lock is None else self._rows.copy())  # type: ignore
 
+    @synchronized
     def __getitem__(self: Self, index: Union[int, slice]):
         if isinstance(index, slice):
-            return self._rows[index.start or 0 : index.stop or len(self._rows) : index.step or 1]
+            rows = self._rows if isinstance(self._rows, list) else list(self._rows)
+            return rows[index.start or 0 : index.stop or len(rows) : index.step or 1]
         try:
             return self._rows[index]
         except IndexError as exc:
             raise IndexError(f"Row index {index} is out of range.") from exc
 
+    @synchronized
     def __add__(self: Self, other: "Table") -> "Table":
         other_columns = len(other[0])
         self_columns = len(self._columns)
@@ -51,35 +159,123 @@ class Table(Element):
             self._rows.append(row)
             for index, cell in enumerate(row):
                 self._columns[index].add(cell)
+        self._evict()
         return self
 
     def __str__(self: Self) -> str:
+        return self.render()
+
+    def render(  # pylint: disable=too-many-locals
+        self: Self,
+        max_width: Optional[int] = None,
+        policy: Policy = "min-ragged",
+        overflow: Overflow = "wrap",
+    ) -> str:
+        """Generates a visual representation of the table, at most `max_width` characters wide.
+
+        Column widths are allocated by a layout `policy`, `min-ragged` or `proportional`, and text
+        that doesn't fit is wrapped or, with the `ellipsis` overflow, cut short with an ellipsis.
+
+        Conditional formats and then style rules are resolved first, and give their style to the
+        rows and cells they select unless these have their own.
+
+        With `border_collapse`, row and cell borders are replaced by one grid of shared rules in the
+        table border style, `single` if it has none.
+        """
+        if overflow not in (overflows := get_args(get_args(Overflow)[1])):
+            raise ValueError(f"Invalid overflow {overflow!r}. Expected one of {overflows}")
+        if self._lock is not None:
+            return self.snapshot().render(max_width, policy, overflow)
+        originals, cache = list(self._rows), self._renders
         if self.preserve:
-            self = deepcopy(self)  # pylint: disable=self-cls-assignment
-        for column in self._columns:
-            column.normalize()
-        any_left_border = any_right_border = False
-        for row in self._rows:
-            any_left_border = any_left_border or bool(row.border.left.style)
-            any_right_border = any_right_border or bool(row.border.right.style)
-        for row in self._rows:
-            row.font += self.font
-            row.cellspacing = max(row.cellspacing, self.colspacing)
-            if any_left_border and not row.border.left.style:
-                row.padding.left += 1
-            if any_right_border and not row.border.right.style:
-                row.padding.right += 1
-            row.preserve = False
-        return self._render(("\n" + "\n" * self.rowspacing).join(map(str, self._rows)))
+            with phase("copy"):
+                self = deepcopy(self)  # pylint: disable=self-cls-assignment
+        collapse = self.border_collapse and bool(self._columns)
+        with phase("rules"):
+            self._apply_formats()
+            self._apply_rules()
+        self._normalize_rows(collapse)
+        widths: List[Optional[int]] = [None] * len(self._columns)
+        if max_width is not None:
+            widths = list(self._fit(max_width, policy, overflow))
+        for column, width in zip(self._columns, widths):
+            column.normalize(width)
+        top = middle = bottom = vertical = ""
+        if collapse:
+            border = self.border if self.border.style else Border("single", self.border.color)
+            outer_widths = list(map(self._outer_width, self._columns))
+            outer_widths[0] += self.padding.left
+            outer_widths[-1] += self.padding.right
+            top, middle, bottom, vertical = border.grid(outer_widths)
+        rows = self._render_rows(originals, cache, vertical)
+        if collapse:
+            text = self._render_grid(rows, (top, middle, bottom, vertical), outer_widths)
+            text = self.margin.apply(self.background.apply(text))
+        else:
+            text = self._render(("\n" + "\n" * self.rowspacing).join(rows))
+        with phase("coalesce"):
+            return emitted(coalesce(text))
 
     def add_row(self: Self, entries: Iterable[Any]) -> None:
-        """Adds a row."""
-        self.insert_row(len(self._rows), entries)
+        """Adds a row.
+
+        In concurrent mode, the row is queued without waiting for the table lock and added before
+        the next operation that reads or changes the table.
+        """
+        if self._lock is None:
+            self.insert_row(len(self._rows), entries)
+        else:
+            self._pending.append(list(entries))
 
     def add_column(self: Self, entries: Iterable[Any]) -> None:
         """Adds a column."""
         self.insert_column(len(self._columns), entries)
 
+    @synchronized
+    def add_rows(self: Self, rows: Iterable[Iterable[Any]]) -> None:
+        """Adds many rows in one pass."""
+        cells_rows = [list(map(Cell, entries)) for entries in rows]
+        if not cells_rows:
+            return
+        self._add_empty_columns(max(map(len, cells_rows)) - len(self._columns))
+        for cells in cells_rows:
+            cells.extend(Cell("") for _ in range(len(self._columns) - len(cells)))
+            self._rows.append(row := Row())
+            row.extend(cells)
+        for column, column_cells in zip(self._columns, zip(*cells_rows)):
+            column.extend(column_cells)
+        if computed := self._computed_columns():
+            for row in islice(self._rows, max(len(self._rows) - len(cells_rows), 1), None):
+                self._compute(row, computed)
+        self._evict()
+
+    @synchronized
+    def add_rule(self: Self, rule: Rule) -> None:
+        """Adds a style rule, applied when rendering after the rules added before it."""
+        self.rules.append(rule)
+
+    @synchronized
+    def add_format(self: Self, conditional_format: Format) -> None:
+        """Adds a conditional format of a column, e.g. a `Threshold`, `Heatmap` or `TopK`."""
+        self.formats.append(conditional_format)
+
+    @synchronized
+    def add_computed_column(self: Self, name: Any, function: Callable[[Mapping], Any]) -> None:
+        """Adds a column computed from the other values of each row after the header, including
+        rows added later.
+
+        The function gets a mapping of header values to row values, e.g.
+        `lambda row: row["qty"] * row["price"]`, and is called when a value is first read. Values
+        are memoized and recomputed only when a cell they were computed from gets a new value.
+        """
+        if not self._rows:
+            raise ValueError("Computed columns need a header row.")
+        self.add_column((name,))
+        self._columns[-1].function = function
+        for row in islice(self._rows, 1, None):
+            self._compute(row, {len(self._columns) - 1: function})
+
+    @synchronized
     def insert_row(self: Self, index: int, entries: Iterable[Any]) -> None:
         """Inserts a row."""
         entries = list(entries)
@@ -87,18 +283,18 @@ class Table(Element):
         if len_entries < len_columns:
             entries += [""] * (len_columns - len_entries)
         elif len_entries > len_columns:
-            for _ in range(len_entries - len_columns):
-                self._columns.append(column := Column())
-                for row in self._rows:
-                    row.add(cell := Cell(""))
-                    column.add(cell)
+            self._add_empty_columns(len_entries - len_columns)
         row = Row()
         for cell in map(Cell, entries):
             row.add(cell)
         self._rows.insert(index, row)
         for column_index, cell in enumerate(row):
             self._columns[column_index].insert(index, cell)
+        if (computed := self._computed_columns()) and self._rows[0] is not row:
+            self._compute(row, computed)
+        self._evict()
 
+    @synchronized
     def insert_column(self: Self, index: int, entries: Iterable[Any]) -> None:
         """Inserts a column."""
         entries = list(entries)
@@ -111,47 +307,97 @@ class Table(Element):
                 for column in self._columns:
                     column.add(cell := Cell(""))
                     row.add(cell)
-        column = Column()
+        column = self._new_column()
         for cell in map(Cell, entries):
             column.add(cell)
         self._columns.insert(index, column)
-        for row_index, cell in enumerate(column):
-            self._rows[row_index].insert(index, cell)
+        for row, cell in zip(self._rows, column):
+            row.insert(index, cell)
+        self._evict()
 
+    @synchronized
     def remove_row(self: Self, index: int) -> None:
         """Removes a row."""
-        row = self._get_row(index)
-        for column_index, cell in enumerate(row):
-            self._columns[column_index].remove(cell)
-        self._rows.remove(row)
+        self._get_row(index)
+        del self._rows[index]
+        for column in self._columns:
+            column.pop(index)
 
+    @synchronized
     def remove_column(self: Self, index: int) -> None:
         """Removes a column."""
-        column = self._get_col(index)
-        for row_index, cell in enumerate(column):
-            self._rows[row_index].remove(cell)
-        self._columns.remove(column)
+        self._get_col(index)
+        del self._columns[index]
+        for row in self._rows:
+            row.pop(index)
+
+    @synchronized
+    def delete_rows(self: Self, indices: Iterable[int]) -> None:
+        """Removes rows at given indices in one pass."""
+        if indices := self._get_indices(indices, len(self._rows), "Row"):
+            rows = [row for index, row in enumerate(self._rows) if index not in indices]
+            self._rows = rows if isinstance(self._rows, list) else deque(rows)
+            for column in self._columns:
+                column.delete(indices)
 
+    @synchronized
+    def delete_columns(self: Self, indices: Iterable[int]) -> None:
+        """Removes columns at given indices in one pass."""
+        if indices := self._get_indices(indices, len(self._columns), "Column"):
+            self._columns = [col for index, col in enumerate(self._columns) if index not in indices]
+            for row in self._rows:
+                row.delete(indices)
+
+    @synchronized
+    def delete_where(self: Self, predicate: Callable[[Row], bool]) -> None:
+        """Removes rows matching a predicate in one pass."""
+        self.delete_rows([index for index, row in enumerate(self._rows) if predicate(row)])
+
+    @synchronized
     def swap_rows(self: Self, index1: int, index2: int) -> None:
         """Swaps rows."""
         self._rows[index1], self._rows[index2] = self._get_row(index2), self._get_row(index1)
         for column in self._columns:
             column.swap(index1, index2)
 
+    @synchronized
     def swap_columns(self: Self, index1: int, index2: int) -> None:
         """Swaps columns."""
         self._columns[index1], self._columns[index2] = self._get_col(index2), self._get_col(index1)
         for row in self._rows:
             row.swap(index1, index2)
 
+    @synchronized
     def sort_rows(self: Self, key: int, start: int = 0, reverse: bool = False) -> None:
-        """Sorts rows by a given key column."""
-        for index, row in enumerate(
-            sorted(self._rows[start:], key=lambda row: f"{row[key].value}", reverse=reverse),
-            start=start,
-        ):
-            self.swap_rows(index1=index, index2=self._rows.index(row))
+        """Sorts rows by a given key column, by value if the column has a dtype, else as text.
+
+        In typed columns, empty values are sorted last, and the first row is left first if the table
+        `has_header` or its value doesn't fit the dtype, e.g. the text header of an `int` column.
+        Pass `start=1` to leave the header of a `str` or `category` column first.
+        """
+        if not self._rows:
+            return
+        start = min(start, len(self._rows))
+        column = self._get_col(key)
+        values: Sequence[int] = range(start, len(column))
+        empties: List[int] = []
+        if column.dtype:
+            keys: List[Any] = [cell.value for cell in column]
+            if start == 0 and keys and (self.has_header or not fits(keys[0], column.dtype)):
+                start = 1
+            empties = [index for index in range(start, len(keys)) if keys[index] in (None, "")]
+            values = [index for index in range(start, len(keys)) if keys[index] not in (None, "")]
+        else:
+            keys = [f"{cell.value}" for cell in column]
+        order = list(range(start))
+        order += sorted(values, key=keys.__getitem__, reverse=reverse) + empties
+        rows = self._rows if isinstance(self._rows, list) else list(self._rows)
+        permuted = [rows[index] for index in order]
+        self._rows = permuted if isinstance(self._rows, list) else deque(permuted)
+        for each in self._columns:
+            each.permute(order)
 
+    @synchronized
     def sort_columns(self: Self, key: int, start: int = 0, reverse: bool = False) -> None:
         """Sorts columns by a given key row."""
         for index, column in enumerate(
@@ -160,21 +406,415 @@ class Table(Element):
         ):
             self.swap_columns(index1=index, index2=self._columns.index(column))
 
+    @synchronized
+    def set_dtype(
+        self: Self, index: int, dtype: DType, format_spec: str = "", has_header: bool = True
+    ) -> None:
+        """Converts the values of a column to a dtype: `int`, `float`, `bool`, `date`, `str` or
+        `category`.
+
+        The format spec, e.g. `",.2f"`, is applied to the typed values when rendering. Categorical
+        columns share one `Category` per distinct value between cells, so values are stored,
+        rendered and replaced once per category; assigning a cell value takes it out of its
+        category.
+        """
+        column = self._get_col(index)
+        cells = column[int(has_header) :]
+        if dtype == "category":
+            categories: Dict[Any, Category] = {}
+            for cell in cells:
+                if (category := categories.get(value := cell.value)) is None:
+                    category = categories[value] = Category(value)
+                cell.value = category
+            column.categories = list(categories.values())
+        else:
+            values = [parse(cell.value, dtype) for cell in cells]
+            for cell, value in zip(cells, values):
+                cell.value = value
+            column.categories = []
+        column.dtype, column.format_spec = dtype, format_spec
+
+    @synchronized
+    def infer_dtypes(self: Self, has_header: bool = True) -> None:
+        """Sets the narrowest dtype that fits the values of each column."""
+        for index, column in enumerate(self._columns):
+            dtype = infer(cell.value for cell in column[int(has_header) :])
+            self.set_dtype(index, dtype, column.format_spec, has_header)
+
     def find(self: Self, value: Any) -> None:
         """Displays a table highlighting matches."""
         repl = Background(color="yellowgreen").apply(f"{value}")
         print(self._render(re.sub(f"{value}", repl, unstyle(str(self)), re.IGNORECASE)))
 
+    @synchronized
     def replace(self: Self, old: Any, new: Any) -> None:
-        """Replaces matching values."""
+        """Replaces matching values, once per category in categorical columns."""
+        changed: Dict[Category, None] = {}
+        for column in self._columns:
+            for category in column.categories:
+                if re.findall(f"{old}", f"{category.value}"):
+                    category.value = re.sub(f"{old}", new, f"{category.value}", 0, re.IGNORECASE)
+                    changed[category] = None
         for row in self._rows:
             for cell in row:
-                if re.findall(f"{old}", f"{cell.value}"):
+                if isinstance(text := cell.text.text, Category):
+                    if text in changed:  # the category was changed without setting `cell.value`
+                        cell.invalidate_dependents()
+                elif re.findall(f"{old}", f"{cell.value}"):
                     cell.value = re.sub(f"{old}", new, f"{cell.value}", 0, re.IGNORECASE)
 
+    @synchronized
+    def join(  # pylint: disable=too-many-locals
+        self: Self, other: "Table", on: Any, how: JoinType = "inner"
+    ) -> "Table":
+        """Joins rows of another table with equal values in key columns into a new table.
+
+        The first row of each table is its header, and `on` names one key column or a list of key
+        columns in both headers. Rows are matched through a hash index of the other table. The
+        result has the columns of this table followed by the non-key columns of the other table.
+        """
+        if how not in get_args(get_args(JoinType)[1]):
+            raise ValueError(
+                f"Invalid join type {how!r}. Expected one of {get_args(get_args(JoinType)[1])}"
+            )
+        names = list(on) if isinstance(on, (list, tuple)) else [on]
+        left, right = _values(self), _values(other)
+        left_header, right_header = left[0] if left else [], right[0] if right else []
+        left_keys = [self._get_key(left_header, name) for name in names]
+        right_keys = [self._get_key(right_header, name) for name in names]
+        right_rest = [index for index in range(len(right_header)) if index not in right_keys]
+        matches: Dict[Tuple, List[List[Any]]] = {}
+        for values in right[1:]:
+            matches.setdefault(tuple(values[i] for i in right_keys), []).append(values)
+        rows = [left_header + [right_header[i] for i in right_rest]]
+        matched, unmatched = set(), [""] * len(right_rest)
+        for values in left[1:]:
+            if (key := tuple(values[i] for i in left_keys)) in matches:
+                matched.add(key)
+                rows.extend(values + [match[i] for i in right_rest] for match in matches[key])
+            elif how != "inner":
+                rows.append(values + unmatched)
+        if how == "outer":
+            for values in right[1:]:
+                if (key := tuple(values[i] for i in right_keys)) not in matched:
+                    row = [""] * len(left_header)
+                    for index, value in zip(left_keys, key):
+                        row[index] = value
+                    rows.append(row + [values[i] for i in right_rest])
+        table = Table(self.colspacing, self.rowspacing)
+        table.add_rows(rows)
+        return table
+
+    @synchronized
+    def group_by(self: Self, keys: Any) -> "GroupBy":
+        """Groups rows by key columns, named in the header row, for aggregation with `agg()`."""
+        from .groupby import GroupBy  # pylint: disable=import-outside-toplevel
+
+        return GroupBy(self, keys)
+
+    @synchronized
+    def pivot(
+        self: Self, index: Any, columns: Any, values: Any, aggfunc: "Aggregate" = "sum"
+    ) -> "Table":
+        """Aggregates a column into a new table by the values of index and label columns."""
+        from .groupby import pivot  # pylint: disable=import-outside-toplevel
+
+        return pivot(self, index, columns, values, aggfunc)
+
+    @staticmethod
+    def concat(tables: Iterable["Table"], direction: Direction = "vertical") -> "Table":
+        """Concatenates the values of tables into a new table, vertically or horizontally.
+
+        Tables with fewer columns (vertically) or rows (horizontally) are padded with empty cells.
+        """
+        tables = list(tables)
+        table = Table(tables[0].colspacing, tables[0].rowspacing) if tables else Table()
+        if direction == "vertical":
+            table.add_rows(chain.from_iterable(_values(other) for other in tables))
+        elif direction == "horizontal":
+            height = max(map(len, tables), default=0)
+            blocks = [_values(other, height) for other in tables]
+            table.add_rows(list(chain.from_iterable(values)) for values in zip(*blocks))
+        else:
+            raise ValueError(
+                f"Invalid concatenation direction {direction!r}. "
+                f"Expected one of {get_args(get_args(Direction)[1])}"
+            )
+        return table
+
+    @synchronized
     def clear(self: Self) -> None:
         """Removes all rows."""
-        self._rows, self._columns = [], []
+        self._rows, self._columns = type(self._rows)(), []  # type: ignore
+        self._renders.clear()
+
+    @synchronized
+    def copy(self: Self) -> "Table":
+        """Copies the table, sharing only immutable values with it."""
+        return deepcopy(self)
+
+    @synchronized
+    def snapshot(self: Self) -> "Table":
+        """Gets a copy of the table that shares its cells but not its rows and columns.
+
+        The copy is taken in one step, so renders and dumps of it are consistent while other
+        threads keep changing the table. In concurrent mode, `str(table)` renders a snapshot.
+        """
+        return copy(self)
+
+    def _flush(self: Self) -> None:
+        if self._pending:
+            rows = []
+            while self._pending:
+                rows.append(self._pending.popleft())
+            self.add_rows(rows)
+
+    def _new_column(self: Self) -> Column:
+        column = Column()
+        if self.max_rows is not None:
+            column.use_deque()
+        return column
+
+    def _computed_columns(self: Self) -> Dict[int, Callable[[Mapping], Any]]:
+        """Gets the function of each computed column, by position."""
+        return {
+            index: column.function
+            for index, column in enumerate(self._columns)
+            if column.function is not None
+        }
+
+    def _compute(self: Self, row: Row, functions: Dict[int, Callable[[Mapping], Any]]) -> None:
+        """Gives the cells of a row after the header the values of computed columns."""
+        header = self._rows[0]
+        for index, function in functions.items():
+            cell = row[index]
+            cell.value = Computed(function, row, header, cell)
+
+    def _evict(self: Self) -> None:
+        if self.max_rows is None:
+            return
+        start = int(self.has_header)
+        while len(self._rows) - start > self.max_rows:
+            self._renders.pop(self._row_key(self._rows[start]), None)
+            del self._rows[start]
+            for column in self._columns:
+                column.pop(start)
+
+    def _fit(self: Self, max_width: int, policy: Policy, overflow: Overflow) -> List[int]:
+        """Allocates column widths so that rows, once normalized, are at most `max_width` wide."""
+        if self.border_collapse:
+            chrome = self.margin.left + self.margin.right + len(self._columns) + 1
+            chrome += self.padding.left + self.padding.right
+        else:
+            chrome = self._inline_chrome(self)
+            chrome += max(
+                (
+                    self._inline_chrome(row) + row.cellspacing * (len(row) - 1)
+                    for row in self._rows
+                    if row
+                ),
+                default=0,
+            )
+        measures = [column.measure() for column in self._columns]
+        chrome += sum(measure.chrome for measure in measures)
+        with phase("layout"):
+            widths = fit(measures, max_width - chrome, policy)
+        if overflow == "ellipsis":
+            for column, measure, width in zip(self._columns, measures, widths):
+                if width < measure.natural:
+                    for cell in column:
+                        cell.text.wrap = False
+                        cell.text.placeholder = ELLIPSIS
+        return widths
+
+    @staticmethod
+    def _inline_chrome(element: Element) -> int:
+        margin, padding, border = element.margin, element.padding, element.border
+        return (
+            margin.left
+            + margin.right
+            + padding.left
+            + padding.right
+            + bool(border.left.style)
+            + bool(border.right.style)
+        )
+
+    def _apply_rules(self: Self) -> None:
+        """Styles rows and cells by the rules selecting them, resolving each set of rules once.
+
+        Rules selecting whole rows style the rows, not their cells, and rules selecting cells by
+        column or value take precedence over them.
+        """
+        if not self.rules:
+            return
+        rules, length, width = self.rules, len(self._rows), len(self._columns)
+        share = self.preserve  # only copies made to be rendered share style objects
+        styles: Dict[Tuple[int, ...], Tuple[Font, Background]] = {}
+        columns_by_rules: Dict[Tuple[int, ...], List[Tuple[int, ...]]] = {}
+
+        def restyle(element: Element, signature: Tuple[int, ...]) -> None:
+            if (style := styles.get(signature)) is None:
+                style = styles[signature] = resolve([rules[index] for index in signature])
+            self._restyle(element, style, share)
+
+        for row_index, row in enumerate(self._rows):
+            selected = tuple(
+                i for i, rule in enumerate(rules) if rule.selects_row(row_index, length)
+            )
+            if signature := tuple(i for i in selected if not rules[i].by_cell):
+                restyle(row, signature)
+            if (columns := columns_by_rules.get(selected)) is None:
+                columns = columns_by_rules[selected] = [
+                    tuple(
+                        i
+                        for i in selected
+                        if rules[i].by_cell and rules[i].selects_column(j, width)
+                    )
+                    for j in range(width)
+                ]
+            for cell, candidates in zip(row, columns):
+                if candidates and (
+                    signature := tuple(i for i in candidates if rules[i].selects_value(cell.value))
+                ):
+                    restyle(cell, signature)
+
+    def _apply_formats(self: Self) -> None:
+        """Styles cells by the conditional formats of their columns, evaluated column by column.
+
+        Formats of columns that don't exist are skipped.
+        """
+        share = self.preserve
+        for each in self.formats:
+            if not -len(self._columns) <= each.column < len(self._columns):
+                continue  # e.g. added before the rows, or its column was removed
+            cells = self._columns[each.column][each.start :]
+            palette = each.palette
+            for cell, index in zip(cells, each.indices([cell.value for cell in cells])):
+                if index != -1:
+                    self._restyle(cell, palette[index], share)
+
+    @staticmethod
+    def _restyle(element: Element, style: Tuple[Font, Background], share: bool) -> None:
+        """Gives an element a font and background, unless it has its own, sharing them if asked."""
+        font, background = style if share else (style[0].copy(), style[1].copy())
+        if element.font.style or element.font.color:
+            element.font += font
+        else:
+            element.font = font
+        if element.background.color is None:
+            element.background = background
+
+    def _normalize_rows(self: Self, collapse: bool) -> None:
+        """Sets the table font and spacing to rows, removing row and cell borders to collapse."""
+        if collapse:
+            for row in self._rows:
+                row.border.style = None
+                for cell in row:
+                    cell.border.style = None
+        any_left_border = any_right_border = False
+        for row in self._rows:
+            any_left_border = any_left_border or bool(row.border.left.style)
+            any_right_border = any_right_border or bool(row.border.right.style)
+        inherit = bool(self.font.style or self.font.color)
+        for row in self._rows:
+            if inherit:
+                row.font += self.font
+            row.cellspacing = max(row.cellspacing, self.colspacing)
+            if any_left_border and not row.border.left.style:
+                row.padding.left += 1
+            if any_right_border and not row.border.right.style:
+                row.padding.right += 1
+            row.preserve = False
+
+    def _render_rows(
+        self: Self, originals: List[Row], cache: Dict[int, Tuple[Tuple, str]], vertical: str
+    ) -> List[str]:
+        """Renders normalized rows, between vertical rules if given, reusing cached ring rows.
+
+        Rows of single-line cells are rendered from templates compiled once per cell style.
+        """
+        templates: Templates = {}
+        if self.max_rows is None:
+            if vertical:
+                return [self._render_grid_row(row, vertical, templates) for row in self._rows]
+            return [row.render(templates) for row in self._rows]
+        renders: Dict[int, Tuple[Tuple, str]] = {}
+        rows = []
+        for original, row in zip(originals, self._rows):
+            key = self._row_key(original)
+            rows.append(self._render_row(row, key, (cache, renders), vertical, templates))
+        cache.clear()
+        cache.update(renders)
+        return rows
+
+    @staticmethod
+    def _outer_width(column: Column) -> int:
+        if not column:
+            return 0
+        cell = column[0]
+        return (
+            cell.margin.left
+            + cell.margin.right
+            + cell.padding.left
+            + cell.padding.right
+            + cell.width
+        )
+
+    def _render_grid(
+        self: Self, rows: List[str], rules: Tuple[str, str, str, str], widths: List[int]
+    ) -> str:
+        """Joins rendered grid rows with the rules, the table padding and `rowspacing`."""
+        top, middle, bottom, vertical = rules
+        left, right = " " * self.padding.left, " " * self.padding.right
+        if left or right:
+            size = len(vertical)
+            rows = [
+                "\n".join(
+                    vertical + left + line[size:-size] + right + vertical
+                    for line in row.split("\n")
+                )
+                for row in rows
+            ]
+        blank = [vertical + vertical.join(" " * width for width in widths) + vertical]
+        separator = "\n".join((*blank * self.rowspacing, middle, *blank * self.rowspacing))
+        body = f"\n{separator}\n".join(rows)
+        padding = self.padding
+        return "\n".join((top, *blank * padding.top, body, *blank * padding.bottom, bottom))
+
+    @staticmethod
+    def _render_grid_row(row: Row, vertical: str, templates: Templates) -> str:
+        text = row.background.apply(row.join(vertical, templates))
+        return "\n".join(vertical + line + vertical for line in text.split("\n"))
+
+    @staticmethod
+    def _row_key(row: Row) -> int:
+        return id(row[0]) if row else id(row)  # snapshots copy rows but share their cells
+
+    @staticmethod
+    def _render_row(
+        row: Row,
+        key: int,
+        caches: Tuple[Dict[int, Tuple[Tuple, str]], Dict[int, Tuple[Tuple, str]]],
+        vertical: str,
+        templates: Templates,
+    ) -> str:
+        """Renders a ring row, unless the previous render, in the first cache, is still valid."""
+        cache, renders = caches
+        render_key = (vertical, *row.render_key())
+        if (render := cache.get(key)) is None or render[0] != render_key:
+            if vertical:
+                render = (render_key, Table._render_grid_row(row, vertical, templates))
+            else:
+                render = (render_key, row.render(templates))
+        renders[key] = render
+        return render[1]
+
+    def _add_empty_columns(self: Self, count: int) -> None:
+        for _ in range(count):
+            self._columns.append(column := self._new_column())
+            for row in self._rows:
+                row.add(cell := Cell(""))
+                column.add(cell)
 
     def _get_row(self: Self, index: int) -> Row:
         if abs(index) > len(self._rows):
@@ -185,3 +825,26 @@ class Table(Element):
         if abs(index) > len(self._columns):
             raise IndexError(f"Column index {index} is out of range.")
         return self._columns[index]
+
+    @staticmethod
+    def _get_key(header: List[Any], name: Any) -> int:
+        try:
+            return header.index(name)
+        except ValueError as exc:
+            raise KeyError(f"No column {name!r} found in the table header.") from exc
+
+    @staticmethod
+    def _get_indices(indices: Iterable[int], length: int, kind: str) -> Set[int]:
+        positions = set()
+        for index in indices:
+            if not -length <= index < length:
+                raise IndexError(f"{kind} index {index} is out of range.")
+            positions.add(index % length)
+        return positions
+
+
+def _values(table: Table, height: int = 0) -> List[List[Any]]:
+    values = [[cell.value for cell in row] for row in table]
+    width = len(values[0]) if values else 0
+    values.extend([""] * width for _ in range(height - len(values)))
+    return values
@@ -0,0 +1,92 @@
+"""Defines display width helpers: `display_width()`, `ljust()`, `rjust()`, `center()`, `clip()`,
+`wrap()`."""
+
+import re
+from functools import lru_cache
+from typing import List
+from unicodedata import category, east_asian_width
+from .ansi import SGR_RE
+
+CHUNK_RE = re.compile("[ ]+|[^ ]+")
+"""Pattern splitting text into runs of spaces and words."""
+
+
+@lru_cache(maxsize=8192)
+def display_width(text: str) -> int:
+    """Gets the number of terminal columns taken by text, ignoring escape sequences."""
+    if "\033" in text:
+        text = SGR_RE.sub("", text)
+    if text.isascii():
+        return len(text)
+    return sum(map(char_width, text))
+
+
+@lru_cache(maxsize=4096)
+def char_width(char: str) -> int:
+    """Gets the number of terminal columns taken by a character: 0, 1 or 2."""
+    if category(char) in ("Mn", "Me", "Cf"):  # combining marks and zero-width formatters
+        return 0
+    if east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+def ljust(text: str, width: int, fillchar: str = " ") -> str:
+    """Pads text on the right to a display width."""
+    return text + fillchar * (width - display_width(text))
+
+
+def rjust(text: str, width: int, fillchar: str = " ") -> str:
+    """Pads text on the left to a display width."""
+    return fillchar * (width - display_width(text)) + text
+
+
+def center(text: str, width: int, fillchar: str = " ") -> str:
+    """Pads text on both sides to a display width, the same way `str.center` does."""
+    if (margin := width - display_width(text)) <= 0:
+        return text
+    left = margin // 2 + (margin & width & 1)
+    return fillchar * left + text + fillchar * (margin - left)
+
+
+def clip(text: str, width: int) -> str:
+    """Cuts text down to a display width without splitting wide characters."""
+    if display_width(text) <= width:
+        return text
+    used = 0
+    for index, char in enumerate(text):
+        if (used := used + char_width(char)) > width:
+            return text[:index]
+    return text
+
+
+def wrap(text: str, width: int) -> List[str]:
+    """Wraps text into lines no wider than a display width.
+
+    Lines are filled like `textwrap.wrap` fills them, except that words are only broken at
+    spaces and long words are broken by display width.
+    """
+    width = max(width, 1)
+    measure = len if text.isascii() else display_width
+    chunks = CHUNK_RE.findall(text)
+    chunks.reverse()
+    lines: List[str] = []
+    while chunks:
+        if chunks[-1][0] == " " and lines:
+            chunks.pop()
+            continue
+        line: List[str] = []
+        used = 0
+        while chunks and used + (chunk_width := measure(chunks[-1])) <= width:
+            line.append(chunks.pop())
+            used += chunk_width
+        if chunks and measure(chunks[-1]) > width:
+            if piece := clip(chunks[-1], width - used) or ("" if line else chunks[-1][0]):
+                line.append(piece)
+                if rest := chunks.pop()[len(piece) :]:
+                    chunks.append(rest)
+        if line and line[-1][0] == " ":
+            line.pop()
+        if line:
+            lines.append("".join(line))
+    return lines
@@ -0,0 +1,38 @@
+"""Tests computed columns."""
+
+from tabling import Table
+
+
+def make_table() -> Table:
+    """Makes a table with a computed column."""
+    table = Table()
+    table.add_rows([["a", "b"], [1, 2], [3, 4]])
+    table.add_computed_column("total", lambda row: row["a"] + row["b"])
+    return table
+
+
+def dependents(table: Table) -> list:
+    """Gets the number of values computed from each cell."""
+    return [len(cell._dependents or []) for row in table for cell in row]
+
+
+def test_renders_keep_dependents() -> None:
+    """Rendering copies the table without registering copies on the original cells."""
+    table = make_table()
+    first = str(table)
+    counts = dependents(table)
+    for _ in range(5):
+        assert str(table) == first
+    assert dependents(table) == counts
+
+
+def test_computed_from_computed() -> None:
+    """A column computed from a computed column renders after earlier renders."""
+    table = make_table()
+    str(table)
+    table.add_computed_column("double", lambda row: row["total"] * 2)
+    str(table)
+    counts = dependents(table)
+    assert [cell.value for cell in table._get_col(-1)] == ["double", 6, 14]
+    str(table)
+    assert dependents(table) == counts
@@ -0,0 +1,26 @@
+"""Tests grouping and pivoting."""
+
+from tabling import Table
+from tabling.groupby import pivot
+
+
+def test_pivot_empty_values() -> None:
+    """Combinations with only empty values are empty, like missing combinations."""
+    table = Table()
+    table.add_rows([["k", "c", "v"], ["a", "x", 1], ["a", "y", ""], ["b", "x", 2]])
+    result = pivot(table, "k", "c", "v")
+    assert [[cell.value for cell in row] for row in result] == [
+        ["k", "x", "y"],
+        ["a", 1, ""],
+        ["b", 2, ""],
+    ]
+
+
+def test_extremes_of_mixed_values() -> None:
+    """Numbers rank before text in min and max."""
+    table = Table()
+    table.add_rows([["k", "n"], ["a", "3"], ["a", "x"], ["a", "1"]])
+    smallest = table.group_by("k").agg({"n": "min"})
+    largest = table.group_by("k").agg({"n": "max"})
+    assert [cell.value for cell in list(smallest)[1]] == ["a", "1"]
+    assert [cell.value for cell in list(largest)[1]] == ["a", "x"]
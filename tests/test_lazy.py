@@ -0,0 +1,17 @@
+"""Tests lazy tables."""
+
+from pathlib import Path
+from tabling import Table
+from tabling.io import csv
+from tabling.lazy import LazyTable
+
+
+def test_stray_quote(tmp_path: Path) -> None:
+    """A quote inside an unquoted field doesn't move the records after it."""
+    path = tmp_path / "stray.csv"
+    path.write_text('n,a,b\n1,x,y\n3,a"b,plain\n4,"multi\nline",z\n5,q,r\n6,s,t\n', newline="")
+    table = Table()
+    csv.load(table, str(path))
+    with LazyTable(str(path)) as lazy:
+        assert list(lazy) == [[cell.value for cell in row] for row in table]
+        assert lazy[-1] == ["6", "s", "t"]
@@ -0,0 +1,75 @@
+"""Tests tables."""
+
+from tabling import Table
+
+
+def values(table: Table) -> list:
+    """Gets the values of the rows of a table."""
+    return [[cell.value for cell in row] for row in table]
+
+
+def test_sort_empty_table() -> None:
+    """Sorting a table without rows does nothing."""
+    table = Table()
+    table.sort_rows(0)
+    assert not table
+
+
+def test_sort_past_last_row() -> None:
+    """Sorting from a start after the last row does nothing."""
+    table = Table()
+    table.add_rows([["b"], ["a"]])
+    table.sort_rows(0, start=5)
+    assert values(table) == [["b"], ["a"]]
+
+
+def test_sort_typed_column() -> None:
+    """Typed columns keep their header first and empty values last, in both directions."""
+    table = Table()
+    table.add_rows([["n"], [3], [""], [1], [None], [2]])
+    table.set_dtype(0, "int")
+    table.sort_rows(0)
+    assert values(table) == [["n"], [1], [2], [3], [""], [None]]
+    table.sort_rows(0, reverse=True)
+    assert values(table) == [["n"], [3], [2], [1], [""], [None]]
+
+
+def test_render_wide_enough() -> None:
+    """Rendering in enough width keeps the natural widths, including those of empty columns."""
+    plain, bordered = Table(), Table(border_collapse=True)
+    for table in (plain, bordered):
+        table.add_rows([["a", "", "long text"], ["bb", "", 12]])
+    bordered.border.style = "single"
+    for table in (plain, bordered):
+        assert table.render(max_width=200) == str(table)
+
+
+def test_collapsed_padding_and_rowspacing() -> None:
+    """Collapsed grids keep the table padding inside the border and space rows around rules."""
+    table = Table(rowspacing=1, border_collapse=True)
+    table.add_rows([["a", "bb"], ["ccc", "d"]])
+    table.padding.inline = (1, 2)
+    table.padding.top = 1
+    assert str(table).split("\n") == [
+        "┌────┬────┐",
+        "│    │    │",
+        "│ a  │bb  │",
+        "│    │    │",
+        "├────┼────┤",
+        "│    │    │",
+        "│ ccc│d   │",
+        "└────┴────┘",
+    ]
+
+
+def test_replace_categories() -> None:
+    """Replacing changes each category once, in copies independently of the original."""
+    table = Table()
+    table.add_rows([["k"], ["ab"], ["ab"], ["x"]])
+    table.set_dtype(0, "category")
+    table.add_computed_column("upper", lambda row: f"{row['k']}".upper())
+    str(table)
+    copy = table.copy()
+    table.replace("ab", "zz")
+    assert values(table) == [["k", "upper"], ["zz", "ZZ"], ["zz", "ZZ"], ["x", "X"]]
+    assert values(copy) == [["k", "upper"], ["ab", "AB"], ["ab", "AB"], ["x", "X"]]